@@ -29,6 +29,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QUrl, QSize, QTimer
 from question.loader import QuestionProcessor
+from question.bank_loader import BankLoader
 from pages.shared_ui import create_footer_buttons, apply_theme, SettingsDialog, create_main_footer_buttons, QuestionWidget, setup_exit_handling
 from pages.ques_functions import load_pages, upload_excel
 from tts.tts_worker import TextToSpeech
@@ -165,6 +166,10 @@ class MainWindow(QMainWindow):
         self.language = language
         set_language(self.language)
 
+        # Parse the question workbooks off the GUI thread while the menu shows
+        self.bank_loader = BankLoader()
+        self.bank_loader.warm_all()
+
         self.setWindowTitle(f"Maths Tutor - {self.language}")
         self.resize(900, 600)
         self.setMinimumSize(800, 550)
@@ -208,6 +213,11 @@ class MainWindow(QMainWindow):
         set_language(new_language)
         self.setWindowTitle(f"Maths Tutor - {self.language}")
 
+        # Banks only hold the active language's templates; fetch the new
+        # column in the background while the UI is rebuilt.
+        self.bank_loader.cancel_waiters()
+        self.bank_loader.warm_all()
+
         if hasattr(self, 'tts'):
             self.tts.stop()
 
@@ -507,11 +517,23 @@ class MainWindow(QMainWindow):
 
     def start_game_mode(self):
         """Entry point for Game Mode. Conditionally runs warmup if logic is missing."""
+        self.bank_loader.when_ready("logic", self._route_game_mode)
+
+    def _route_game_mode(self):
+        from question.bank import get_bank
+        from question.progression import LogicError, progression_graph
         from question.warmup import _load_logic_df
         logic_df = _load_logic_df()
         if logic_df is None or logic_df.empty:
             print("[DEBUG] gamemode_logic.xlsx is empty — launching warmup")
             self._launch_warmup()
+            return
+        try:
+            progression_graph(get_bank("logic"))
+        except LogicError as e:
+            # The warmup writes a fresh logic sheet
+            print(f"[GAME] gamemode_logic.xlsx is not usable ({e}) — launching warmup")
+            self._launch_warmup()
         else:
             print("[DEBUG] gamemode_logic.xlsx is populated — entering game mode directly")
             self._launch_game_mode_intro()
@@ -555,6 +577,9 @@ class MainWindow(QMainWindow):
     def _begin_warmup_questions(self):
         """Transition from intro screen to the question widget."""
         print("[DEBUG] Entered _begin_warmup_questions()")
+        self.bank_loader.when_ready("game", self._open_warmup_questions)
+
+    def _open_warmup_questions(self):
         try:
             from question.warmup import WarmupSession
             from pages.warmup_ui import WarmupQuestionWidget
@@ -652,6 +677,9 @@ class MainWindow(QMainWindow):
 
     def _start_game_session(self):
         """Create GameModeSession + GameModeWidget, start 90s timer."""
+        self.bank_loader.when_ready(["game", "logic"], self._open_game_session)
+
+    def _open_game_session(self):
         from question.warmup import GameModeSession
         from pages.warmup_ui import GameModeWidget
         from pages.shared_ui import apply_theme
@@ -738,6 +766,11 @@ class MainWindow(QMainWindow):
         self._launch_game_mode_intro()
 
     def load_game_questions(self, difficulty_index):
+        self.bank_loader.when_ready(
+            "game", lambda: self._open_game_questions(difficulty_index)
+        )
+
+    def _open_game_questions(self, difficulty_index):
         from question.loader import LinearProgressionSession
         from PyQt5.QtWidgets import QVBoxLayout, QProgressBar, QWidget, QPushButton
         from language.language import tr
@@ -771,7 +804,12 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'tts') and not self.is_muted:
             self.tts.speak(tr("Game mode! Let's go!"))
 
-        processor = self.game_session.get_next_question()
+        # The session draws the questions; one processor checks the answers
+        questions = self.game_session.questions()
+        processor = QuestionProcessor("game", self.game_session.level_index,
+                                      disable_dda=True, is_game_mode=True,
+                                      seed=self.game_session.seed, rng=self.game_session.rng,
+                                      recent=self.game_session.recent)
 
         def load_next_question():
             if not self.game_active:
@@ -781,7 +819,7 @@ class MainWindow(QMainWindow):
             if result:
                 self.question_widget._last_result = None
                 self.game_session.submit_answer(
-                    result['skill'],
+                    result['question'],
                     result['correct'],
                     result['elapsed'],
                     result.get('replay_count', 0)
@@ -792,12 +830,11 @@ class MainWindow(QMainWindow):
                 self._end_game_session()
                 return
 
-            next_processor = self.game_session.get_next_question()
-            self.question_widget.processor = next_processor
             self.question_widget.load_new_question()
 
         from pages.shared_ui import QuestionWidget
-        self.question_widget = QuestionWidget(processor, window=self, next_question_callback=load_next_question, tts=self.tts)
+        self.question_widget = QuestionWidget(processor, window=self, next_question_callback=load_next_question,
+                                              tts=self.tts, questions=questions)
         self.game_page_layout.addWidget(self.question_widget)
 
         self.stack.setCurrentWidget(self.game_page_container)
@@ -943,7 +980,7 @@ class MainWindow(QMainWindow):
         if upload_btn: upload_btn.hide()
 
     def start_quickplay_mode(self):
-        self._proceed_to_quickplay()
+        self.bank_loader.when_ready("learning", self._proceed_to_quickplay)
 
     def _proceed_to_quickplay(self):
         if hasattr(self, 'tts'):
@@ -978,8 +1015,6 @@ class MainWindow(QMainWindow):
         processor = QuestionProcessor("Story", difficultyIndex=[0, 1])
 
         def load_next_question():
-            new_processor = QuestionProcessor("Story", difficultyIndex=[0, 1])
-            self._quickplay_question_widget.processor = new_processor
             self._quickplay_question_widget.load_new_question()
 
         self._quickplay_question_widget = QuestionWidget(processor, window=self, next_question_callback=load_next_question, tts=self.tts)
@@ -991,15 +1026,6 @@ class MainWindow(QMainWindow):
         if self.is_muted:
             return
 
-        if filename.startswith("tts_cache_"):
-            try:
-                sounds_dir = "sounds"
-                for f in os.listdir(sounds_dir):
-                    if f.startswith("tts_cache_") and f != filename:
-                        os.remove(os.path.join(sounds_dir, f))
-            except Exception:
-                pass
-
         filepath = os.path.abspath(os.path.join("sounds", filename))
         if os.path.exists(filepath):
             self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(filepath)))
@@ -1152,6 +1178,7 @@ class MainWindow(QMainWindow):
 
     def back_to_main_menu(self):
         self.top_bar.show()
+        self.bank_loader.cancel_waiters()
 
         for attr in ('_warmup_question_widget', '_warmup_intro_widget', '_warmup_ranking_widget'):
             widget = getattr(self, attr, None)
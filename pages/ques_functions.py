@@ -1,10 +1,10 @@
-import pandas as pd
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QFileDialog, QMessageBox, QHBoxLayout, QWidget,
+    QFileDialog, QMessageBox, QHBoxLayout, QWidget, QProgressDialog,
     QVBoxLayout, QGridLayout, QPushButton, QLabel, QSizePolicy
 )
 from question.loader import QuestionProcessor
+from question.importer import import_running, start_import
 # pages/ques_functions.py
 
 from pages.shared_ui import (
@@ -61,27 +61,69 @@ def load_pages(section_name, back_callback, difficulty_index,
     # ✅ For other sections
     return create_dynamic_question_ui(section_name, difficulty_index, back_callback, main_window=main_window, tts=tts)
 
-uploaded_df = None
+uploaded_bank = None
 
 def upload_excel(parent_widget):
+    if import_running(parent_widget):
+        QMessageBox.information(parent_widget, "Uploading",
+                                "Please wait for the current upload to finish.")
+        return
     file_path, _ = QFileDialog.getOpenFileName(parent_widget, "Select Excel File", "", "Excel Files (*.xlsx)")
     if not file_path:
         return
 
-    df = pd.read_excel(file_path)
-    global uploaded_df
-    uploaded_df = df
-
-    print(uploaded_df)
-  
-    required = {"question", "operands", "equation"}
-    if not required.issubset(df.columns):
-        QMessageBox.critical(parent_widget, "Invalid File", "Excel must have columns titled: question, operands, equation")
-        return
-
-    QMessageBox.information(parent_widget, "Success", "Questions uploaded successfully!")
-    
-    main_window = parent_widget
+    # Large banks take seconds to parse, so read them on a worker thread
+    # and keep the UI responsive behind a progress dialog.
+    progress = QProgressDialog("Reading questions...", "Cancel", 0, 0, parent_widget)
+    progress.setWindowTitle("Uploading")
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setMinimumDuration(300)
+    progress.setAccessibleName("Upload progress")
+
+    def on_progress(done, total):
+        if total:
+            progress.setMaximum(total)
+            progress.setValue(min(done, total))
+        progress.setLabelText(f"Reading questions... {done} rows")
+
+    def on_failed(message):
+        progress.close()
+        QMessageBox.critical(parent_widget, "Invalid File", message)
+
+    def on_finished(result):
+        progress.close()
+        print(f"[Upload] {file_path}: {result.valid_rows}/{result.total_rows} rows "
+              f"in {result.seconds * 1000:.0f} ms, {len(result.errors)} skipped")
+        for line, error in result.errors[:20]:
+            print(f"[Upload]   row {line}: {error}")
+
+        if result.valid_rows == 0:
+            QMessageBox.critical(parent_widget, "Invalid File",
+                                 "No usable questions were found in this file.")
+            return
+
+        global uploaded_bank
+        uploaded_bank = result.bank
+
+        if result.errors:
+            shown   = "\n".join(f"Row {line}: {error}" for line, error in result.errors[:10])
+            more    = len(result.errors) - 10
+            if more > 0:
+                shown += f"\n... and {more} more"
+            QMessageBox.warning(
+                parent_widget, "Some Rows Skipped",
+                f"{result.valid_rows} questions uploaded, "
+                f"{len(result.errors)} rows skipped:\n\n{shown}"
+            )
+        else:
+            QMessageBox.information(parent_widget, "Success", "Questions uploaded successfully!")
+        _show_entry_page(parent_widget)
+
+    start_import(file_path, parent_widget, progress=on_progress, finished=on_finished,
+                 failed=on_failed, cancelled=progress.close, cancel=progress.canceled)
+
+
+def _show_entry_page(main_window):
     entry_ui = create_entry_ui(main_window)
     apply_theme(entry_ui, main_window.current_theme)
     
@@ -106,15 +148,12 @@ def load_entry_page(main_window):
   # global storage
 
 def start_uploaded_quiz(main_window):
-    global uploaded_df
-    if uploaded_df is None:
-        print('no uploaded_df')
+    if uploaded_bank is None:
+        print('no uploaded_bank')
         return
 
-    processor = QuestionProcessor("custom", 0)  # pass dummy type and difficulty
-    print('dummy value passed to init of processor')
-    processor.df = uploaded_df  # manually inject uploaded data
-    print(processor.df)
+    # pass dummy type and difficulty; questions come from the uploaded bank
+    processor = QuestionProcessor("custom", 0, view=uploaded_bank.view())
 
     question_widget = QuestionWidget(processor, window=main_window, tts=main_window.tts)
     apply_theme(question_widget, main_window.current_theme)
@@ -8,7 +8,10 @@ from PyQt5.QtWidgets import ( QWidget, QLabel, QHBoxLayout, QPushButton,
 from PyQt5.QtCore import Qt, QSize, QPoint, QTimer, QRegExp
 from PyQt5.QtGui import QFont, QPalette, QColor, QKeySequence, QIcon, QRegExpValidator
 from PyQt5.QtCore import QPropertyAnimation, QSequentialAnimationGroup
+from PyQt5 import sip
 from question.loader import QuestionProcessor
+from question.record import NO_QUESTION, Question
+from question.bank_loader import when_banks_ready, mark_first_question
 from time import time
 import random
 from tts.tts_worker import TextToSpeech
@@ -217,12 +220,14 @@ def setup_exit_handling(window, require_confirmation=False):
 # ---------------------------------------------------------------------------
 
 class QuestionWidget(QWidget):
-    def __init__(self, processor, window=None, next_question_callback=None, tts=None):
+    def __init__(self, processor, window=None, next_question_callback=None, tts=None,
+                 questions=None):
         super().__init__()
         self.setAccessibleName("")
         self.setAccessibleDescription("")
         self.processor              = processor
-        self.answer                 = None
+        self.question               = None
+        self.questions              = questions   # a session's Question iterator, if it drives the widget
         self.start_time             = time()
         self.next_question_callback = next_question_callback
         self.layout                 = QVBoxLayout()
@@ -232,6 +237,7 @@ class QuestionWidget(QWidget):
         self.setProperty("theme", window.current_theme)
         self.tts           = tts if tts else TextToSpeech()
         self._question_count = 0
+        self._prepared     = None   # (processor, Question) picked ahead
         self.is_bell_mode  = (processor.questionType.lower() == "bellring")
         self.bell_press_count = 0
         self._active       = True
@@ -357,20 +363,25 @@ class QuestionWidget(QWidget):
         if hasattr(self, "gif_feedback_label"):
             self.hide_feedback_gif()
 
-        question_text, self.answer = self.processor.get_questions()
+        prepared, self._prepared = self._prepared, None
+        if prepared is not None and prepared[0] is self.processor:
+            question = prepared[1]
+        elif self.questions is not None:
+            question = next(self.questions, None) or Question(NO_QUESTION, None)
+        else:
+            question = self.processor.next_question()
+        self.question = question
+        question_text = question.text
         self._active    = True
+        # The processor can outlive a question (quick play reuses one), so
+        # every new question starts with its full retries
+        self.processor.retry_count = 0
         
         self.start_time = None
         self.replay_count = 0
 
-        app_tts_active = (
-            self.main_window
-            and not self.main_window.is_muted
-            and self.processor.questionType.lower() != "bellring"
-        )
-
         delay_ms = 0
-        if app_tts_active and hasattr(self, 'tts'):
+        if self._speaks_questions() and hasattr(self, 'tts'):
             tts_text = f"{question_text}. {tr('Type your answer')}"
             
             # Accessibility Timer Fix: Time is len(text) * 70ms + 500ms + 1000ms cognitive buffer
@@ -414,6 +425,37 @@ class QuestionWidget(QWidget):
             QTimer.singleShot(100, lambda: self.input_box.setFocus(Qt.OtherFocusReason))
 
         self._question_count += 1
+        mark_first_question(self.main_window)
+
+    def _speaks_questions(self):
+        return (
+            self.main_window
+            and not self.main_window.is_muted
+            and self.processor.questionType.lower() != "bellring"
+        )
+
+    def prefetch_next_question(self):
+        """
+        Pick the next question while the feedback for this one is showing,
+        so the transition only has to display it. Skipped when a
+        next_question_callback decides what comes next.
+        """
+        if self.next_question_callback or not self._active:
+            return
+        question = self.processor.next_question()
+        self._prepared = (self.processor, question)
+        if self._speaks_questions() and hasattr(self, 'tts'):
+            self.prepare_speech(self.tts, question)
+
+    @staticmethod
+    def prepare_speech(tts, question):
+        """
+        Have `tts` render the clip for `question` ahead of time, queued
+        after the spoken feedback so it is not held up. The warmup and game
+        mode widgets call this too.
+        """
+        tts_text = f"{question.text}. {tr('Type your answer')}"
+        QTimer.singleShot(100, lambda: tts.prepare(tts_text))
 
     def play_bell_sounds(self, count):
         if not hasattr(self, "bell_timer"):
@@ -465,9 +507,9 @@ class QuestionWidget(QWidget):
         elapsed    = time() - self.start_time if getattr(self, 'start_time', None) else 0
         
         try:
-            result = self.processor.submit_answer(user_input, self.answer, elapsed, self.replay_count)
+            result = self.processor.submit_answer(user_input, self.question, elapsed, self.replay_count)
         except TypeError:
-            result = self.processor.submit_answer(user_input, self.answer, elapsed)
+            result = self.processor.submit_answer(user_input, self.question, elapsed)
 
         if not result["valid"]:
             msg = tr("Please enter a valid number.")
@@ -478,7 +520,7 @@ class QuestionWidget(QWidget):
         correct = result["correct"]
         self._last_result = {
             'correct': correct, 'elapsed': elapsed,
-            'skill':   self.processor.questionType,
+            'question': self.question,
             'replay_count': getattr(self, 'replay_count', 0)
         }
 
@@ -524,6 +566,7 @@ class QuestionWidget(QWidget):
                     QTimer.singleShot(10, lambda t=clean_feedback: self.tts.speak(t))
 
             self.processor.retry_count = 0
+            self.prefetch_next_question()
             QTimer.singleShot(2000, self.call_next_question)
             return
 
@@ -542,6 +585,7 @@ class QuestionWidget(QWidget):
                     self.main_window.play_sound("wrong-anwser-1.mp3")
                 if hasattr(self.main_window, '_update_timer_bar'):
                     self.main_window._update_timer_bar()
+                self.prefetch_next_question()
                 QTimer.singleShot(300, self.call_next_question)
                 return
             else:
@@ -549,6 +593,7 @@ class QuestionWidget(QWidget):
                     self.result_label.setText(
                         f'<span style="font-size:16pt;">{tr("Let\'s try another one!")}</span>'
                     )
+                    self.prefetch_next_question()
                     QTimer.singleShot(2000, self.call_next_question)
                     return
 
@@ -675,14 +720,14 @@ class QuestionWidget(QWidget):
         count = self.bell_press_count
         self.bell_press_count = 0
 
-        try:    correct_answer = int(self.answer)
+        try:    correct_answer = int(self.question.answer)
         except: correct_answer = -1
 
         elapsed    = time() - self.start_time if getattr(self, 'start_time', None) else 0
         is_correct = (count == correct_answer)
         self._last_result = {
             'correct': is_correct, 'elapsed': elapsed,
-            'skill':   self.processor.questionType,
+            'question': self.question,
             'replay_count': getattr(self, 'replay_count', 0)
         }
 
@@ -720,6 +765,7 @@ class QuestionWidget(QWidget):
                     QTimer.singleShot(300, lambda t=clean: self.tts.speak(t))
 
             self.processor.retry_count = 0
+            self.prefetch_next_question()
             QTimer.singleShot(2000, self.call_next_question)
 
         else:
@@ -743,6 +789,7 @@ class QuestionWidget(QWidget):
                     self.result_label.setText(
                         f'<span style="font-size:16pt;">{tr("Let\'s try another one!")}</span>'
                     )
+                    self.prefetch_next_question()
                     QTimer.singleShot(2000, self.call_next_question)
                     return
 
@@ -782,9 +829,23 @@ def create_dynamic_question_ui(section_name, difficulty_index, back_callback,
         print(f"[BellRing] Overriding difficulty {difficulty_index} -> 1")
         difficulty_index = 1
 
-    processor = QuestionProcessor(section_name, difficulty_index)
-    processor.process_file()
-    layout.addWidget(QuestionWidget(processor, main_window, tts=tts))
+    loading = QLabel(tr("Loading questions..."))
+    loading.setAlignment(Qt.AlignCenter)
+    loading.setAccessibleName(tr("Loading questions..."))
+    layout.addWidget(loading)
+
+    def add_question_widget():
+        if sip.isdeleted(container):
+            return
+        layout.removeWidget(loading)
+        loading.deleteLater()
+        processor = QuestionProcessor(section_name, difficulty_index)
+        processor.process_file()
+        layout.addWidget(QuestionWidget(processor, main_window, tts=tts))
+        apply_theme(container, main_window.current_theme)
+
+    # Excel parsing happens on the bank loader's thread, not here
+    when_banks_ready(main_window, "learning", add_question_widget)
     apply_theme(container, main_window.current_theme)
     return container
 
@@ -18,6 +18,8 @@ from time import time
 from question.warmup import (
     SCORE_INFO, AUTO_SKIP_SECONDS, WarmupSession
 )
+from question.bank_loader import mark_first_question
+from pages.shared_ui import QuestionWidget
 from language.language import tr
 
 
@@ -154,8 +156,9 @@ class WarmupQuestionWidget(QWidget):
 
         self._active              = True
         self._question_start_time = None
-        self._current_answer      = None
-        self._current_question_text = ""
+        self._current_question    = None
+        self._questions           = session.questions()
+        self._prepared            = None   # (step_index, Question) picked ahead
 
         self.setAccessibleName("Warmup Question")
         self._init_ui()
@@ -313,21 +316,20 @@ class WarmupQuestionWidget(QWidget):
         self.submit_btn.setEnabled(True)
         self.skip_btn.setEnabled(True)
 
-        # Build processor and get question
-        processor = self.session.get_current_processor()
-        if processor is None or (processor.df is not None and processor.df.empty):
-            # No data for this step → auto-skip silently
+        # Use the question picked during the last feedback, if it is for this step
+        prepared, self._prepared = self._prepared, None
+        if prepared is not None and prepared[0] == self.session.step_index:
+            question = prepared[1]
+        else:
+            question = next(self._questions, None)
+        if question is None or question.answer is None:
+            # No data or no answer for this step → auto-skip silently
             self.session.skip_question()
             QTimer.singleShot(0, self._load_current_step)
             return
 
-        question_text, self._current_answer = processor.get_questions()
-        self._current_question_text = question_text
-
-        if question_text == "No questions found." or self._current_answer is None:
-            self.session.skip_question()
-            QTimer.singleShot(0, self._load_current_step)
-            return
+        question_text = question.text
+        self._current_question = question
 
         # Adjust font size by length
         length = len(question_text)
@@ -339,6 +341,7 @@ class WarmupQuestionWidget(QWidget):
             self.question_lbl.setStyleSheet("")
 
         self.question_lbl.setText(question_text)
+        mark_first_question(self.window)
 
         # TTS + deferred timer start
         self._question_start_time = None
@@ -354,6 +357,17 @@ class WarmupQuestionWidget(QWidget):
 
         QTimer.singleShot(100, self.input_box.setFocus)
 
+    def _prefetch_next(self):
+        """Pick the next step's question while the feedback for this one is showing."""
+        if not self._active or self.session.is_complete():
+            return
+        question = next(self._questions, None)
+        if question is None:
+            return
+        self._prepared = (self.session.step_index, question)
+        if question.answer is not None and self.tts and self.window and not self.window.is_muted:
+            QuestionWidget.prepare_speech(self.tts, question)
+
     def _on_tts_done(self):
         if not self._active:
             return
@@ -382,7 +396,7 @@ class WarmupQuestionWidget(QWidget):
 
         try:
             user_val    = float(user_text)
-            correct_val = float(self._current_answer)
+            correct_val = float(self._current_question.answer)
             is_correct  = (user_val == correct_val)
         except (TypeError, ValueError):
             self.feedback_lbl.setText('<span style="color:#E74C3C;">✗ Invalid — try again</span>')
@@ -403,6 +417,7 @@ class WarmupQuestionWidget(QWidget):
             )
             if self.tts and self.window and not self.window.is_muted:
                 QTimer.singleShot(50, lambda: self.tts.speak(f"Correct! {label}"))
+            self._prefetch_next()
             QTimer.singleShot(1400, self._advance)
         else:
             self.feedback_lbl.setText(
@@ -410,6 +425,7 @@ class WarmupQuestionWidget(QWidget):
             )
             if self.tts and self.window and not self.window.is_muted:
                 QTimer.singleShot(50, lambda: self.tts.speak("Wrong."))
+            self._prefetch_next()
             QTimer.singleShot(1200, self._advance)
 
     def _on_skip(self):
@@ -421,6 +437,7 @@ class WarmupQuestionWidget(QWidget):
         self.submit_btn.setEnabled(False)
         self.skip_btn.setEnabled(False)
         self.feedback_lbl.setText('<span style="color:#95A5A6; font-size:18pt;">⏭ Skipped</span>')
+        self._prefetch_next()
         QTimer.singleShot(800, self._advance)
 
     def _on_autoskip(self):
@@ -433,6 +450,7 @@ class WarmupQuestionWidget(QWidget):
         self.submit_btn.setEnabled(False)
         self.skip_btn.setEnabled(False)
         self.feedback_lbl.setText('<span style="color:#95A5A6; font-size:18pt;">⏱ Time out — auto-skipped</span>')
+        self._prefetch_next()
         QTimer.singleShot(1000, self._advance)
 
     def _advance(self):
@@ -674,7 +692,9 @@ class GameModeWidget(QWidget):
         self.session = session; self.window = window; self.tts = tts
         self.on_session_end = on_session_end
         self._active = True; self._question_start_time = None
-        self._current_answer = None; self._current_config = None
+        self._current_question = None
+        self._questions = session.questions()
+        self._prepared  = None   # Question picked during the last feedback
         self.setAccessibleName("Game Mode Active"); self._init_ui(); self._load_next_question()
 
     def _init_ui(self):
@@ -717,23 +737,29 @@ class GameModeWidget(QWidget):
         self.feedback_lbl.setFont(QFont("Arial",20,QFont.Bold)); self.feedback_lbl.setFixedHeight(46)
         root.addWidget(self.feedback_lbl); root.addStretch(1)
 
+    def _prefetch_next(self):
+        """Pick the next question while the feedback for this one is showing."""
+        if not self._active: return
+        self._prepared = question = next(self._questions, None)
+        if question is not None and question.answer is not None and self.tts and not self.window.is_muted:
+            QuestionWidget.prepare_speech(self.tts, question)
+
     def _load_next_question(self):
         if not self._active: return
-        self._current_config = self.session.get_next_question_config()
-        if self._current_config is None: self._finish(); return
-        processor = self.session.build_processor(self._current_config)
-        if processor.df is None or processor.df.empty:
-            self.session.skip_question(self._current_config); QTimer.singleShot(0, self._load_next_question); return
-        question_text, self._current_answer = processor.get_questions()
-        if question_text == "No questions found." or self._current_answer is None:
-            self.session.skip_question(self._current_config); QTimer.singleShot(0, self._load_next_question); return
+        prepared, self._prepared = self._prepared, None
+        question = prepared or next(self._questions, None)
+        if question is None: self._finish(); return
+        self._current_question = question; question_text = question.text
+        self.session.question_shown(question)
+        if question.answer is None:
+            self.session.skip_question(question); QTimer.singleShot(0, self._load_next_question); return
         self.level_lbl.setText(f"🎮 {self.session.level_name()}")
         self.phase_lbl.setText("")
         self.qcount_lbl.setText(f"Q{self.session.question_count+1}")
-        self.type_lbl.setText(self._current_config["label"])
+        self.type_lbl.setText(question.label)
         ln = len(question_text)
         self.question_lbl.setStyleSheet("font-size:14pt;" if ln>120 else "font-size:18pt;" if ln>80 else "")
-        self.question_lbl.setText(question_text)
+        self.question_lbl.setText(question_text); mark_first_question(self.window)
         self.feedback_lbl.setText(""); self.input_box.clear()
         self.input_box.setEnabled(True); self.submit_btn.setEnabled(True); self.skip_btn.setEnabled(True)
         self._question_start_time = None
@@ -752,11 +778,11 @@ class GameModeWidget(QWidget):
         if not self._active: return
         user_text = self.input_box.text().strip()
         if not user_text: self.input_box.setFocus(); return
-        try: is_correct = (float(user_text) == float(self._current_answer))
+        try: is_correct = (float(user_text) == float(self._current_question.answer))
         except (TypeError, ValueError):
             self.feedback_lbl.setText('<span style="color:#E74C3C;">✗ Invalid</span>'); self.input_box.setFocus(); return
         elapsed = (time()-self._question_start_time) if self._question_start_time else 0.0
-        score   = self.session.submit_answer(self._current_config, is_correct, elapsed)
+        score   = self.session.submit_answer(self._current_question, is_correct, elapsed)
         self.input_box.setEnabled(False); self.submit_btn.setEnabled(False); self.skip_btn.setEnabled(False)
         if is_correct:
             self.window.time_remaining = min(self.window.time_remaining+3, self.session.session_time)
@@ -768,21 +794,21 @@ class GameModeWidget(QWidget):
             emoji, tier = SCORE_INFO.get(score, ("✓",""))
             self.feedback_lbl.setText(f'<span style="color:#27AE60;">{emoji} {tier}</span>')
             if self.tts and not self.window.is_muted: QTimer.singleShot(50, lambda t=tier: self.tts.speak(t))
-            QTimer.singleShot(1200, self._load_next_question)
+            self._prefetch_next(); QTimer.singleShot(1200, self._load_next_question)
         else:
             self.feedback_lbl.setText('<span style="color:#E74C3C;">✗ Wrong</span>')
             if self.tts and not self.window.is_muted: QTimer.singleShot(50, lambda: self.tts.speak("Wrong"))
-            QTimer.singleShot(900, self._load_next_question)
+            self._prefetch_next(); QTimer.singleShot(900, self._load_next_question)
 
     def _on_skip(self):
         if not self._active: return
-        self.session.skip_question(self._current_config)
+        self.session.skip_question(self._current_question)
         self.window.time_remaining = max(0, self.window.time_remaining-2)
         self.update_timer(self.window.time_remaining)
         from question.warmup import save_game_session; save_game_session(self.session.save_state())
         self.feedback_lbl.setText('<span style="color:#95A5A6;">⏭ Skipped</span>')
         self.input_box.setEnabled(False); self.submit_btn.setEnabled(False); self.skip_btn.setEnabled(False)
-        QTimer.singleShot(700, self._load_next_question)
+        self._prefetch_next(); QTimer.singleShot(700, self._load_next_question)
 
     def update_timer(self, secs):
         self.timer_bar.setValue(secs)
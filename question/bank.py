@@ -0,0 +1,703 @@
+"""question/bank.py
+
+Process-wide registry of the question workbooks: each one is parsed once
+into an immutable `QuestionBank` that every session shares, and cached
+as `<name>.bank.npz` next to the workbook for fast cold starts.
+
+    python -m question.bank      # (re)build every cache up front
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+import language.language as lang_config
+from question.cells import is_blank
+from question.compiler import check_frame, report_path
+from question.equation import Equation, EquationError, compile_equation
+from question.operands import OperandError, OperandSpec, parse_operands
+from question.templates import Template, compile_template
+
+BANK_FILES = {
+    "learning": "question.xlsx",
+    "game":     "game_ques.xlsx",
+    "logic":    "gamemode_logic.xlsx",
+}
+
+
+def bank_path(name: str) -> str:
+    return os.path.join(os.getcwd(), "question", BANK_FILES[name])
+
+
+# ── Languages ────────────────────────────────────────────────────────────────
+
+# Translated template column per UI language; English uses `question`.
+LANGUAGE_COLUMNS = {
+    "हिंदी":    "question_hi",
+    "മലയാളം":  "question_mal",
+    "मराठी":    "question_marathi",
+    "தமிழ்":    "question_ta",
+    "عربي":     "question_ar",
+    "संस्कृत":  "question_sa",
+}
+TRANSLATED_BANKS = ("learning", "game")
+
+
+def language_column(language: str | None = None) -> str | None:
+    """Template column for `language` (default: the selected one), or None."""
+    return LANGUAGE_COLUMNS.get(language or lang_config.selected_language)
+
+
+def _is_translation(col) -> bool:
+    return str(col).startswith("question_")
+
+
+def _wanted_translation(name: str) -> str | None:
+    return language_column() if name in TRANSLATED_BANKS else None
+
+
+def _keep_column(col, translation) -> bool:
+    return not _is_translation(col) or col == translation
+
+
+# ── Normalisers ──────────────────────────────────────────────────────────────
+
+# Low-cardinality columns kept as pandas Categoricals: one vocabulary per
+# column, int codes per row. Filters on them compare codes, not strings.
+CATEGORICAL_COLUMNS = ("type", "label", "digits")
+
+
+def _categorical(series: pd.Series, lower: bool = False) -> pd.Series:
+    """
+    `series.astype(str).str.strip()` (and `.str.lower()`), done once per
+    distinct value on the categories instead of once per row. Missing
+    values become "nan", as astype(str) would make them.
+    """
+    cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+    labels = pd.Index(cat.cat.categories.astype(str)).str.strip()
+    if lower:
+        labels = labels.str.lower()
+    labels = labels.append(pd.Index(["nan"]))        # slot for missing values
+
+    remap, vocab = pd.factorize(labels)
+    codes = cat.cat.codes.to_numpy()                 # -1 picks the "nan" slot
+    return pd.Series(pd.Categorical.from_codes(remap[codes], categories=vocab),
+                     index=series.index, name=series.name)
+
+
+def _digit_int(digits: pd.Series) -> pd.Series:
+    """Leading integer of each `digits` value ("2d" -> 2), 1 if there is none."""
+    levels = (
+        pd.Series(digits.cat.categories).str.extract(r'(\d+)', expand=False)
+        .pipe(pd.to_numeric, errors="coerce")
+        .fillna(1).astype(int).to_numpy()
+    )
+    return pd.Series(levels[digits.cat.codes.to_numpy()], index=digits.index)
+
+
+def _normalise_learning(df: pd.DataFrame) -> pd.DataFrame:
+    df["type"]       = _categorical(df["type"], lower=True)
+    df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce")
+    return df
+
+
+def _normalise_game(df: pd.DataFrame) -> pd.DataFrame:
+    df["type"]       = _categorical(df["type"], lower=True)
+    df["digits"]     = _categorical(df["digits"], lower=True)
+    df["label"]      = _categorical(df["label"])
+    df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce").fillna(0).astype(int)
+    df["_digit_int"] = _digit_int(df["digits"])
+    return df
+
+
+def _normalise_logic(df: pd.DataFrame) -> pd.DataFrame:
+    if len(df) == 0:
+        return df
+
+    df["label"] = _categorical(df["label"])
+    df["forward"] = df["forward"].astype(str).str.strip()
+    df["backward"] = df["backward"].astype(str).str.strip()
+    df["warmup_order"] = pd.to_numeric(df["warmup_order"], errors="coerce")
+    df["minimum_correct"] = pd.to_numeric(df["minimum_correct"], errors="coerce").fillna(2).astype(int)
+
+    # Handle the spelling typo in excel 'maximun_wrong' gracefully
+    if "maximun_wrong" in df.columns:
+        df["maximum_wrong"] = pd.to_numeric(df["maximun_wrong"], errors="coerce").fillna(3).astype(int)
+    else:
+        df["maximum_wrong"] = pd.to_numeric(df.get("maximum_wrong", 3), errors="coerce").fillna(3).astype(int)
+    return df
+
+
+def _intern_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make equal strings share one object per column. The workbooks repeat
+    the same template text across many rows. Categorical columns already
+    store each value once and are left alone.
+    """
+    for col in df.columns:
+        if is_numeric_dtype(df[col]) or isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        codes, uniques = pd.factorize(df[col])
+        pool   = np.array([sys.intern(v) if isinstance(v, str) else v for v in uniques]
+                          + [np.nan], dtype=object)
+        df[col] = pool[codes]            # code -1 (missing) picks the trailing NaN
+    return df
+
+
+NORMALISERS = {
+    "learning": _normalise_learning,
+    "game":     _normalise_game,
+    "logic":    _normalise_logic,
+}
+
+
+# ── Row index ────────────────────────────────────────────────────────────────
+
+EMPTY_ROWS = np.empty(0, dtype=np.intp)
+NO_CODE    = -2      # code() result for a value not in the vocabulary; matches no row
+
+
+def _positions(df: pd.DataFrame, cols) -> dict:
+    if isinstance(cols, str):
+        cols = [cols]
+    if any(c not in df.columns for c in cols) or df.empty:
+        return {}
+    keys = cols[0] if len(cols) == 1 else cols
+    return {k: np.asarray(v, dtype=np.intp)
+            for k, v in df.groupby(keys, sort=False, observed=True).indices.items()}
+
+
+class BankIndex:
+    """
+    Row-position lookups over one bank, built once per bank version.
+
+    All arrays hold positional row numbers into the bank's frame, in
+    ascending order, so selecting questions never scans the whole frame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.all                = np.arange(len(df), dtype=np.intp)
+        self.by_type            = _positions(df, "type")
+        self.by_label           = _positions(df, "label")
+        self.by_difficulty      = _positions(df, "difficulty")
+        self.by_type_difficulty = _positions(df, ["type", "difficulty"])
+        self.digits = (df["_digit_int"].to_numpy()
+                       if "_digit_int" in df.columns else None)
+
+    def rows(self, type=None, difficulty=None, label=None,
+             max_digit=None, exclude_types=None) -> np.ndarray:
+        """
+        Rows matching every given filter. `difficulty` may be a single
+        level or a list; multi-level results are ordered by difficulty.
+        """
+        if difficulty is not None:
+            levels = difficulty if isinstance(difficulty, (list, tuple, set)) else [difficulty]
+            levels = sorted(set(levels))
+
+        if type is not None and difficulty is not None:
+            parts = [self.by_type_difficulty.get((type, d), EMPTY_ROWS) for d in levels]
+            rows  = np.concatenate(parts) if parts else EMPTY_ROWS
+        elif type is not None:
+            rows = self.by_type.get(type, EMPTY_ROWS)
+        elif difficulty is not None:
+            parts = [self.by_difficulty.get(d, EMPTY_ROWS) for d in levels]
+            rows  = np.concatenate(parts) if parts else EMPTY_ROWS
+        else:
+            rows = self.all
+
+        if label is not None:
+            by_label = self.by_label.get(label, EMPTY_ROWS)
+            rows = by_label if rows is self.all else rows[np.isin(rows, by_label)]
+        if exclude_types:
+            rows = self.without_types(rows, exclude_types)
+        if max_digit is not None and self.digits is not None:
+            rows = rows[self.digits[rows] <= max_digit]
+        return rows
+
+    def without_types(self, rows: np.ndarray, types) -> np.ndarray:
+        excluded = [self.by_type.get(t, EMPTY_ROWS) for t in types]
+        if not excluded:
+            return rows
+        return rows[~np.isin(rows, np.concatenate(excluded))]
+
+
+# ── QuestionBank ─────────────────────────────────────────────────────────────
+
+_BLANK = Template("", [], [])       # marks a compiled blank cell
+
+
+class BankView:
+    """
+    A selection of rows from one bank, in a given order. Filtering or
+    sampling a view returns another view; no row data is ever copied.
+    """
+
+    __slots__ = ("bank", "rows")
+
+    def __init__(self, bank: "QuestionBank", rows=None):
+        self.bank = bank
+        self.rows = bank.index.all if rows is None else np.asarray(rows, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.rows) == 0
+
+    @property
+    def columns(self):
+        return self.bank.columns
+
+    def column(self, name: str) -> np.ndarray:
+        return self.bank.column(name)[self.rows]
+
+    def codes(self, name: str) -> np.ndarray:
+        return self.bank.codes(name)[self.rows]
+
+    def row(self, i: int) -> pd.Series:
+        """The i-th selected row (position within the view)."""
+        return self.bank.row(self.rows[i])
+
+    def operand_spec(self, i: int) -> OperandSpec:
+        return self.bank.operand_spec(self.rows[i])
+
+    def template(self, i: int, column: str) -> Template | None:
+        return self.bank.template(self.rows[i], column)
+
+    def equation(self, i: int) -> Equation | None:
+        return self.bank.equation(self.rows[i])
+
+    def where(self, mask) -> "BankView":
+        return BankView(self.bank, self.rows[np.asarray(mask, dtype=bool)])
+
+    def take(self, positions) -> "BankView":
+        return BankView(self.bank, self.rows[np.asarray(positions, dtype=np.intp)])
+
+
+class QuestionBank:
+    """
+    One parsed, normalised workbook. Never mutated after construction;
+    read it through `view()`, `row()` and `column()`.
+    """
+
+    def __init__(self, name: str, path: str, df: pd.DataFrame, key: tuple,
+                 version: int = 1, translation: str | None = None):
+        self.name    = name
+        self.path    = path
+        self.key     = key
+        self.version = version
+        self.translation = translation      # the one question_* column loaded
+        self._df     = df
+        self._index  = None
+        self._operand_specs = [None] * len(df)
+        self._templates     = {}        # column -> per-row compiled Template
+        self._equations     = [None] * len(df)
+        self._derived       = {}        # name -> structure built from this version
+        self._columns = {}
+        self._codes   = {}
+        self._vocab   = {}
+        for col in df.columns:
+            values = df[col].to_numpy()
+            values.flags.writeable = False
+            self._columns[col] = values
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                codes = df[col].cat.codes.to_numpy()
+                codes.flags.writeable = False
+                self._codes[col] = codes
+                self._vocab[col] = {v: i for i, v in enumerate(df[col].cat.categories)}
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        A copy of the frame, for whole-table work such as grouping. Edits
+        to it never reach the bank; per-row reads should use `column()`.
+        """
+        return self._df.copy()
+
+    @property
+    def columns(self):
+        return self._df.columns
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array of one column, shared with the bank."""
+        return self._columns[name]
+
+    def get_column(self, name: str) -> np.ndarray | None:
+        """`column(name)`, or None if the workbook has no such column."""
+        return self._columns.get(name)
+
+    def codes(self, name: str) -> np.ndarray:
+        """Integer codes of a categorical column (see `code()`)."""
+        return self._codes[name]
+
+    def code(self, name: str, value) -> int:
+        """Code of `value` in column `name`; NO_CODE if it never occurs."""
+        return self._vocab[name].get(value, NO_CODE)
+
+    def vocabulary(self, name: str) -> pd.Index:
+        return self._df[name].cat.categories
+
+    def row(self, position: int) -> pd.Series:
+        return self._df.iloc[int(position)]
+
+    def operand_spec(self, position: int) -> OperandSpec:
+        """The row's `operands` cell, compiled on first use and kept."""
+        spec = self._operand_specs[position]
+        if spec is None:
+            source     = self._columns["operands"][position]
+            constraint = self._columns.get("constraint")
+            try:
+                spec = parse_operands(source, None if constraint is None else constraint[position])
+            except OperandError as e:
+                # Only reachable for banks built without the schema checks
+                print(f"[Bank] {self.name} row {position}: {e}")
+                spec = OperandSpec(str(source), [], [])
+            self._operand_specs[position] = spec
+        return spec
+
+    def template(self, position: int, column: str) -> Template | None:
+        """
+        The row's `column` template (question, a translation or equation)
+        compiled against its operand variables; None for a blank cell.
+        Compiled on first use and kept.
+        """
+        compiled = self._templates.get(column)
+        if compiled is None:
+            compiled = self._templates.setdefault(column, [None] * len(self))
+        template = compiled[position]
+        if template is None:
+            text = self._columns[column][position]
+            if is_blank(text):
+                template = _BLANK
+            else:
+                text = str(text)
+                if column == "equation":
+                    text = text.replace("×", "*")
+                template = compile_template(text, self.operand_spec(position).variables)
+            compiled[position] = template
+        return None if template is _BLANK else template
+
+    def equation(self, position: int) -> Equation | None:
+        """
+        The row's `equation` compiled to a function of its operands; None
+        for a blank or disallowed cell. Compiled on first use and kept.
+        """
+        equation = self._equations[position]
+        if equation is None:
+            source = self._columns["equation"][position]
+            equation = _BLANK
+            if not is_blank(source):
+                try:
+                    equation = compile_equation(source, self.operand_spec(position).variables)
+                except EquationError as e:
+                    # Only reachable for banks built without the schema checks
+                    print(f"[Bank] {self.name} row {position}: {e}")
+            self._equations[position] = equation
+        return None if equation is _BLANK else equation
+
+    def view(self, rows=None) -> BankView:
+        return BankView(self, rows)
+
+    def derived(self, name: str, build):
+        """
+        `build(bank)`, computed on first use and kept for this bank
+        version. For lookups (bucket plans and the like) that only
+        depend on the rows; a reload builds them again.
+        """
+        value = self._derived.get(name)
+        if value is None:
+            value = self._derived.setdefault(name, build(self))
+        return value
+
+    @property
+    def index(self) -> BankIndex:
+        if self._index is None:
+            self._index = BankIndex(self._df)
+        return self._index
+
+    def rows(self, **filters) -> np.ndarray:
+        return self.index.rows(**filters)
+
+
+def _file_key(path: str) -> tuple:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+# ── Compiled cache ───────────────────────────────────────────────────────────
+
+CACHE_FORMAT = 4        # 4: operand constraints checked
+
+
+def cache_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".bank.npz"
+
+
+def _write_cache(path: str, df: pd.DataFrame, key: tuple):
+    arrays = {
+        "__format__":  np.array(CACHE_FORMAT),
+        "__source__":  np.array(key, dtype=np.int64),
+        "__columns__": np.array([str(c) for c in df.columns], dtype=str),
+    }
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if is_numeric_dtype(series):
+            arrays[f"n{i}"] = series.to_numpy()
+            continue
+        missing = series.isna().to_numpy()
+        values  = np.array([str(v) for v in series[~missing]], dtype=str)
+        vocab, inverse = np.unique(values, return_inverse=True)
+        codes = np.full(len(series), -1, dtype=np.int32)
+        codes[~missing] = inverse
+        arrays[f"c{i}"] = codes
+        arrays[f"v{i}"] = vocab
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)
+    os.replace(tmp, path)
+
+
+def _read_cache(path: str, key: tuple, keep=lambda col: True) -> pd.DataFrame | None:
+    """
+    Return the cached frame, or None if it is missing or stale. Only
+    columns for which `keep(name)` is true are read.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            if int(z["__format__"]) != CACHE_FORMAT or tuple(z["__source__"]) != key:
+                return None
+            data = {}
+            for i, col in enumerate(z["__columns__"]):
+                if not keep(str(col)):
+                    continue
+                if f"n{i}" in z:
+                    data[str(col)] = z[f"n{i}"]
+                    continue
+                codes  = z[f"c{i}"]
+                vocab  = z[f"v{i}"].astype(object)
+                if str(col) in CATEGORICAL_COLUMNS:
+                    data[str(col)] = pd.Categorical.from_codes(codes, categories=vocab)
+                    continue
+                values = np.full(len(codes), np.nan, dtype=object)
+                present = codes >= 0
+                values[present] = vocab[codes[present]]
+                data[str(col)] = values
+            return pd.DataFrame(data)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"[Bank] Ignoring unreadable cache {path}: {e}")
+        return None
+
+
+def compile_workbook(path: str) -> pd.DataFrame:
+    """
+    Parse `path` with openpyxl, schema-check question workbooks, and
+    (re)write the compiled cache of the rows that pass plus the report.
+    """
+    df = pd.read_excel(path)
+    report = check_frame(df, path) if "operands" in df.columns else None
+    if report is not None and report.bad_rows:
+        # Broken rows would otherwise surface mid-quiz as operand 0 or a
+        # None answer; drop them here, once per workbook version.
+        print(f"[Bank] {len(report.bad_rows)} of {len(df)} rows in "
+              f"{os.path.basename(path)} fail schema checks, see {report_path(path)}")
+        df = df.drop(index=df.index[report.bad_rows]).reset_index(drop=True)
+    try:
+        _write_cache(cache_path(path), df, _file_key(path))
+        if report is not None:
+            report.write(report_path(path))
+    except OSError as e:
+        print(f"[Bank] Could not write cache for {path}: {e}")
+    return df
+
+
+def _read_workbook(path: str, key: tuple, translation: str | None) -> pd.DataFrame:
+    keep = lambda col: _keep_column(col, translation)
+    df = _read_cache(cache_path(path), key, keep)
+    if df is not None:
+        return df
+    print(f"[Bank] Compiling {path}")
+    df = compile_workbook(path)
+    df = df.loc[:, [keep(c) for c in df.columns]]
+    # The cache path already shares one object per distinct string
+    return _intern_strings(df)
+
+
+# ── Row diff ─────────────────────────────────────────────────────────────────
+
+def _row_hashes(df: pd.DataFrame) -> pd.Series:
+    return pd.util.hash_pandas_object(df.astype(str), index=False)
+
+
+def diff_rows(old: pd.DataFrame, new: pd.DataFrame) -> dict:
+    """
+    Row-level comparison of two versions of a workbook. Rows are matched
+    by content, so inserting a row does not count everything after it as
+    changed.
+    """
+    if list(old.columns) != list(new.columns):
+        return {"added": len(new), "removed": len(old), "unchanged": 0,
+                "columns_changed": True}
+    old_counts = _row_hashes(old).value_counts()
+    new_counts = _row_hashes(new).value_counts()
+    both       = old_counts.align(new_counts, fill_value=0)
+    unchanged  = int(np.minimum(*both).sum())
+    return {"added":     len(new) - unchanged,
+            "removed":   len(old) - unchanged,
+            "unchanged": unchanged,
+            "columns_changed": False}
+
+
+# ── Registry ─────────────────────────────────────────────────────────────────
+
+_banks: dict[str, QuestionBank] = {}
+_versions: dict[str, int] = {}      # survives invalidate(), so versions never repeat
+_lock = threading.Lock()
+_versions_lock = threading.Lock()
+
+
+def _is_current(bank, path: str, key: tuple, translation=None) -> bool:
+    return (bank is not None and bank.path == path and bank.key == key
+            and bank.translation == translation)
+
+
+def _next_version(name: str) -> int:
+    with _versions_lock:
+        _versions[name] = _versions.get(name, 0) + 1
+        return _versions[name]
+
+
+def _switch_language(bank: QuestionBank, translation: str | None) -> QuestionBank | None:
+    """
+    Same workbook, different language: reuse every column and the index,
+    and read only the new template column from the cache. None if the
+    cache cannot provide it.
+    """
+    df = bank._df.loc[:, [not _is_translation(c) for c in bank._df.columns]]
+    if translation is not None:
+        extra = _read_cache(cache_path(bank.path), bank.key, lambda col: col == translation)
+        if extra is None:
+            return None
+        if translation in extra.columns:
+            df = df.assign(**{translation: extra[translation].to_numpy()})
+    print(f"[Bank] {bank.name}: switched language column to {translation or 'question'}")
+    switched = QuestionBank(bank.name, bank.path, df, bank.key,
+                            _next_version(bank.name), translation)
+    switched._index = bank._index
+    switched._operand_specs = bank._operand_specs      # same rows, same specs
+    switched._equations = bank._equations
+    switched._templates = {col: compiled for col, compiled in bank._templates.items()
+                           if not _is_translation(col)}
+    return switched
+
+
+def _load(name: str, path: str, key: tuple, previous=None) -> QuestionBank:
+    translation = _wanted_translation(name)
+    if _is_current(previous, path, key, previous.translation if previous else None):
+        switched = _switch_language(previous, translation)
+        if switched is not None:
+            return switched
+    print(f"[Bank] Loading {name}: {path}")
+    df = NORMALISERS[name](_read_workbook(path, key, translation))
+    return QuestionBank(name, path, df, key, _next_version(name), translation)
+
+
+def get_bank(name: str) -> QuestionBank:
+    """
+    The registered bank for `name`, as it is: a workbook edited or a
+    language switched since it was registered is picked up by
+    `reload_bank()` (BankLoader runs it on its worker), never here, so
+    GUI-thread callers do not stall on a re-read. Only a bank that was
+    never loaded (or was invalidated) is read on the spot.
+    """
+    bank = _banks.get(name)
+    if bank is not None:
+        return bank
+
+    with _lock:
+        bank = _banks.get(name)
+        if bank is None:
+            path = bank_path(name)
+            bank = _banks[name] = _load(name, path, _file_key(path))
+        return bank
+
+
+def reload_bank(name: str, prepare=None):
+    """
+    Re-read `name` if its workbook changed and swap the new version in.
+
+    Parsing, indexing and `prepare(bank)` happen outside the registry
+    lock, before the swap; if any of them raises, the previous version
+    stays registered. Returns `(bank, diff)`, where `diff` is None when
+    nothing was reloaded or there was no previous version to compare.
+    """
+    path = bank_path(name)
+    key  = _file_key(path)
+    translation = _wanted_translation(name)
+    with _lock:
+        previous = _banks.get(name)
+    if _is_current(previous, path, key, translation):
+        return previous, None
+
+    bank = _load(name, path, key, previous)
+    bank.index
+    if prepare is not None:
+        prepare(bank)
+    with _lock:
+        current = _banks.get(name)
+        if current is not previous and _is_current(current, path, key, translation):
+            return current, None     # someone else already swapped it in
+        _banks[name] = bank
+
+    diff = diff_rows(previous._df, bank._df) if previous is not None else None
+    return bank, diff
+
+
+def is_stale(name: str) -> bool:
+    """True if `name` is cached but its workbook changed since it was read."""
+    bank = _banks.get(name)
+    if bank is None:
+        return False
+    try:
+        return bank.key != _file_key(bank.path)
+    except OSError:
+        return False        # mid-save; the next change event will retry
+
+
+def is_loaded(name: str) -> bool:
+    """True if `name` is cached and still matches the file on disk."""
+    path = bank_path(name)
+    try:
+        key = _file_key(path)
+    except OSError:
+        return False
+    return _is_current(_banks.get(name), path, key, _wanted_translation(name))
+
+
+def get_frame(name: str) -> pd.DataFrame:
+    return get_bank(name).df
+
+
+def invalidate(name: str | None = None):
+    """Drop one cached bank (or all of them) so the next access re-reads it."""
+    with _lock:
+        if name is None:
+            _banks.clear()
+        else:
+            _banks.pop(name, None)
+
+
+if __name__ == "__main__":
+    for bank_name in BANK_FILES:
+        compile_workbook(bank_path(bank_name))
+        print(f"[Bank] Compiled {bank_name} -> {cache_path(bank_path(bank_name))}")
@@ -0,0 +1,211 @@
+"""question/bank_loader.py
+
+Loads the question banks on a worker thread so the GUI thread never
+blocks on Excel parsing. MainWindow starts warming every bank at
+startup; pages call `when_ready()` and are built once their banks are
+in memory.
+
+The loader also watches the workbooks, so edits made while the app is
+running are picked up: the changed bank is re-read on the worker and
+swapped in for sessions started afterwards, while running sessions keep
+the version they began with.
+"""
+
+import os
+from time import perf_counter
+
+from PyQt5.QtCore import (
+    QObject, QThread, QCoreApplication, QFileSystemWatcher, QTimer, pyqtSignal,
+)
+
+from question.bank import BANK_FILES, bank_path, is_loaded, is_stale, reload_bank
+from question.buckets import bucket_plan
+from question.progression import progression_graph
+from question.warmup import warmup_plan
+
+RELOAD_DELAY_MS = 500   # editors often write a workbook in several steps
+
+# Lookups built on the worker along with each bank, so sessions start on ready data
+PREPARE = {"game": (bucket_plan, warmup_plan), "logic": (progression_graph,)}
+
+
+def prepare(bank):
+    bank.index
+    for build in PREPARE.get(bank.name, ()):
+        build(bank)
+
+
+class BankWorker(QObject):
+    loaded = pyqtSignal(str, float)
+    failed = pyqtSignal(str, str)
+    reloaded = pyqtSignal(str, int, dict)
+
+    def load(self, name):
+        start = perf_counter()
+        try:
+            bank, _ = reload_bank(name, prepare)    # first load, or a newer file / language
+            prepare(bank)                           # no-op unless it was loaded elsewhere
+        except Exception as e:
+            self.failed.emit(name, str(e))
+            return
+        self.loaded.emit(name, perf_counter() - start)
+
+    def reload(self, name):
+        try:
+            bank, diff = reload_bank(name, prepare)
+        except Exception as e:
+            self.failed.emit(name, str(e))
+            return
+        if diff is not None:
+            self.reloaded.emit(name, bank.version, diff)
+
+
+class BankLoader(QObject):
+    load_request   = pyqtSignal(str)
+    reload_request = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.started_at     = perf_counter()
+        self.ready_at       = {}
+        self._in_flight     = set()
+        self._waiters       = []
+        self._first_question_logged = False
+
+        self.thread = QThread()
+        self.worker = BankWorker()
+        self.worker.moveToThread(self.thread)
+        self.load_request.connect(self.worker.load)
+        self.reload_request.connect(self.worker.reload)
+        self.worker.loaded.connect(self._on_loaded)
+        self.worker.failed.connect(self._on_failed)
+        self.worker.reloaded.connect(self._on_reloaded)
+        self.thread.start()
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self._reload_changed)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_changed)
+        self.watcher.directoryChanged.connect(self._on_file_changed)
+        self._watch()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    # ── Requests ─────────────────────────────────────────────────────────────
+
+    def warm_all(self):
+        self.request(list(BANK_FILES))
+
+    def request(self, names):
+        for name in names:
+            if name not in self._in_flight:
+                self._in_flight.add(name)
+                self.load_request.emit(name)
+
+    def when_ready(self, names, callback):
+        """
+        Run `callback` once every bank in `names` is in memory: right away
+        if they already are, otherwise after the worker has loaded them.
+        """
+        names   = [names] if isinstance(names, str) else list(names)
+        pending = {n for n in names if not is_loaded(n)}
+        if not pending:
+            callback()
+            return
+        self._waiters.append((pending, callback))
+        self.request(pending)
+
+    def cancel_waiters(self):
+        """Forget queued callbacks, e.g. when the user leaves the page."""
+        self._waiters = []
+
+    # ── Hot reload ───────────────────────────────────────────────────────────
+
+    def _watch(self):
+        """
+        (Re-)add the workbooks to the watcher. Saving via a temp file and
+        rename drops the old path from the watch list, so this runs after
+        every change; the folder itself is watched to catch re-creation.
+        """
+        paths   = [bank_path(n) for n in BANK_FILES]
+        folders = {os.path.dirname(p) for p in paths}
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [p for p in paths + sorted(folders) if p not in watched and os.path.exists(p)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def _on_file_changed(self, _path):
+        self._reload_timer.start()
+
+    def _reload_changed(self):
+        self._watch()
+        for name in BANK_FILES:
+            if name not in self._in_flight and is_stale(name):
+                self.reload_request.emit(name)
+
+    # ── Worker results ───────────────────────────────────────────────────────
+
+    def _on_loaded(self, name, seconds):
+        self.ready_at[name] = perf_counter() - self.started_at
+        print(f"[Bank] {name} ready in {seconds * 1000:.1f} ms")
+        self._settle(name)
+
+    def _on_failed(self, name, error):
+        # Waiters still run: a bad reload leaves the previous version in
+        # place; with no previous one their own get_bank() surfaces the error.
+        print(f"[Bank] Failed to load {name}: {error}")
+        self._settle(name)
+
+    def _on_reloaded(self, name, version, diff):
+        if diff["columns_changed"]:
+            print(f"[Bank] Reloaded {name} v{version}: columns changed, {diff['added']} rows")
+        else:
+            print(f"[Bank] Reloaded {name} v{version}: +{diff['added']} -{diff['removed']} rows "
+                  f"({diff['unchanged']} unchanged)")
+
+    def _settle(self, name):
+        self._in_flight.discard(name)
+        still_waiting = []
+        for pending, callback in self._waiters:
+            pending.discard(name)
+            if pending:
+                still_waiting.append((pending, callback))
+            else:
+                callback()
+        self._waiters = still_waiting
+
+    # ── Metrics ──────────────────────────────────────────────────────────────
+
+    def first_question_shown(self):
+        """Log time-to-first-question once per run, next to the bank timings."""
+        if self._first_question_logged:
+            return
+        self._first_question_logged = True
+        elapsed = (perf_counter() - self.started_at) * 1000
+        banks   = ", ".join(f"{n} {t * 1000:.0f} ms" for n, t in self.ready_at.items())
+        print(f"[Bank] Time to first question: {elapsed:.0f} ms (banks ready: {banks or 'none'})")
+
+    def stop(self):
+        self._reload_timer.stop()
+        self.thread.quit()
+        self.thread.wait()
+
+
+def when_banks_ready(window, names, callback):
+    """`window.bank_loader.when_ready`, or an immediate call when there is no loader."""
+    loader = getattr(window, "bank_loader", None)
+    if loader is None:
+        callback()
+    else:
+        loader.when_ready(names, callback)
+
+
+def mark_first_question(window):
+    loader = getattr(window, "bank_loader", None)
+    if loader is not None:
+        loader.first_question_shown()
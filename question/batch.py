@@ -0,0 +1,113 @@
+"""question/batch.py
+
+Batch question generation.
+
+`generate_batch(view, n)` makes n questions from a BankView in one go:
+the rows are picked with one NumPy call, each picked row draws the
+operands for all of its questions at once (`OperandSpec.draw_many`), its
+compiled equation is evaluated over those operand arrays
+(`Equation.evaluate_many`) and only the final `''.join` of each text is
+done per question. Game mode, warmup and worksheet export can fill a
+pool from this instead of calling `get_random_question` N times.
+
+    python -m question.batch [n]      # questions/second, one by one vs batch
+
+The benchmark reports the best of BENCH_RUNS timings of each path, as
+single runs vary by tens of percent. The ratio depends on the
+one-by-one path as much as on the batch one: roughly 7-13x against the
+per-question path batching was added next to, roughly 5-7x since
+learning mode draws its rows from a RowDeck.
+"""
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+BENCH_RUNS = 5
+
+
+def generate_batch(view, n: int, seed=None, column: str | None = None):
+    """
+    `n` questions drawn (with replacement) from `view`, as two lists:
+    rendered texts and integer answers (None where the equation has no
+    answer for those operands). `column` is the translated template to
+    prefer over `question`; `seed` is an int or a numpy Generator.
+    """
+    if view.empty or n <= 0:
+        return [], []
+    rng  = np.random.default_rng(seed)
+    pick = rng.integers(0, len(view), n)
+
+    texts   = [None] * n
+    answers = [None] * n
+    rows, inverse = np.unique(pick, return_inverse=True)
+    order  = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(rows)))
+    start  = 0
+    for k, local in enumerate(rows.tolist()):
+        slots = order[start:bounds[k]].tolist()
+        start = bounds[k]
+
+        spec     = view.operand_spec(local)
+        operands = spec.draw_many(rng, len(slots))
+
+        template = None
+        if column is not None and column in view.columns:
+            template = view.template(local, column)
+        if template is None:
+            template = view.template(local, "question")
+
+        if template is not None:
+            rendered = [template.render(values) for values in operands.tolist()]
+        else:
+            rendered = [str(view.column("question")[local])] * len(slots)
+
+        equation = view.equation(local)
+        if equation is not None:
+            values = np.round(equation.evaluate_many(operands))
+            solved = [None if v != v else int(v) for v in values.tolist()]
+        else:
+            solved = [None] * len(slots)
+
+        for slot, text, answer in zip(slots, rendered, solved):
+            texts[slot]   = text
+            answers[slot] = answer
+    return texts, answers
+
+
+# ── Benchmark ────────────────────────────────────────────────────────────────
+
+def _benchmark(n: int):
+    from question.loader import QuestionProcessor
+
+    processor = QuestionProcessor("custom", 0)
+    processor.process_file()
+    print(f"[Batch] learning bank: {len(processor.view)} rows, {n} questions, "
+          f"best of {BENCH_RUNS}")
+
+    processor.get_random_question()                 # compile the rows' specs first
+    processor.generate_batch(len(processor.view))
+
+    def best(run):
+        times = []
+        for _ in range(BENCH_RUNS):
+            start = perf_counter()
+            run()
+            times.append(perf_counter() - start)
+        return min(times)
+
+    def one_by_one():
+        for _ in range(n):
+            processor.get_random_question()
+
+    single = best(one_by_one)
+    batch  = best(lambda: processor.generate_batch(n))
+
+    print(f"[Batch] get_random_question: {n / single:12,.0f} questions/s")
+    print(f"[Batch] generate_batch:      {n / batch:12,.0f} questions/s "
+          f"({single / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,79 @@
+"""question/buckets.py
+
+Linear-progression buckets, precomputed per bank.
+
+A linear game walks one difficulty level's labels in a fixed order
+(addition, subtraction, multiplication, division; fewer digits first),
+drawing each question from the current label's rows. `BucketPlan` works
+that out for every level of the game bank in one pass and is kept with
+the bank version (`bucket_plan`), so starting a session, dropping a
+level and drawing a question are all lookups into ready-made row arrays.
+"""
+
+import pandas as pd
+
+from question.cells import is_blank
+
+# Skills interleaved into a linear game rather than given their own buckets
+TIER2_SKILLS = ["story", "time", "currency"]
+
+OP_ORDER = {"addition": 0, "subtraction": 1, "multiplication": 2, "division": 3}
+
+FALLBACK_ROWS = 10      # rows in the single "fallback" bucket of a label-less bank
+
+
+class LevelBuckets:
+    """One level's bucket labels, in play order, and each label's bank rows."""
+
+    __slots__ = ("difficulty", "labels", "rows")
+
+    def __init__(self, difficulty, labels, rows):
+        self.difficulty = difficulty
+        self.labels     = tuple(labels)
+        self.rows       = rows              # label -> read-only array of bank positions
+
+
+class BucketPlan:
+    """Every level's buckets for one bank; built once, never changed."""
+
+    def __init__(self, bank, tier2_skills=TIER2_SKILLS):
+        index = bank.index
+        self._levels = {
+            int(d): self._build(bank, index.without_types(rows, tier2_skills), d)
+            for d, rows in index.by_difficulty.items()
+        }
+        # Levels the bank does not have fall back to level 0, then to every row
+        self._fallback = self._levels.get(0) or self._build(
+            bank, index.without_types(index.all, tier2_skills), None)
+
+    def level(self, difficulty: int) -> LevelBuckets:
+        return self._levels.get(difficulty, self._fallback)
+
+    @staticmethod
+    def _build(bank, main_rows, difficulty) -> LevelBuckets:
+        main_codes = bank.codes("label")[main_rows]
+        vocab      = bank.vocabulary("label")
+        types      = bank.column("type")
+        digits     = bank.column("_digit_int")
+
+        sort_keys, rows = {}, {}
+        for code in pd.unique(main_codes):
+            lbl = vocab[code] if code >= 0 else None
+            if is_blank(lbl):
+                continue
+            label_rows = main_rows[main_codes == code]
+            label_rows.flags.writeable = False
+            first_type = str(types[label_rows[0]]).strip().lower()
+            sort_keys[lbl] = (OP_ORDER.get(first_type, 99), int(digits[label_rows[0]]))
+            rows[lbl]      = label_rows
+
+        labels = sorted(rows, key=sort_keys.__getitem__)
+        if not labels:
+            fallback = bank.index.all[:FALLBACK_ROWS]
+            return LevelBuckets(difficulty, ["fallback"], {"fallback": fallback})
+        return LevelBuckets(difficulty, labels, rows)
+
+
+def bucket_plan(bank) -> BucketPlan:
+    """The game bank's `BucketPlan`, built on first use for each bank version."""
+    return bank.derived("buckets", BucketPlan)
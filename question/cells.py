@@ -0,0 +1,24 @@
+"""question/cells.py
+
+How workbook cells are read before any column-specific parsing: which
+cells count as blank, what a `{placeholder}` looks like and which operand
+it stands for. The operand, template, equation, schema and logic-sheet
+code all use these, so they agree on each.
+"""
+
+import re
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")      # `{a}` stands for variable `a`
+
+
+def is_blank(value) -> bool:
+    """An empty cell: None, whitespace, or the "nan"/"None" text pandas leaves for one."""
+    return value is None or str(value).strip().lower() in ("", "nan", "none")
+
+
+def placeholder_slots(variables) -> dict:
+    """Map each variable name to its index in the operand spec, for `{name}` lookups."""
+    slot_of = {}
+    for i, var in enumerate(variables):
+        slot_of.setdefault(var, i)            # a repeated letter keeps its first value
+    return slot_of
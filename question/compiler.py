@@ -0,0 +1,150 @@
+"""question/compiler.py
+
+Schema checks for question rows, run once when a bank is compiled or
+loaded instead of failing (or silently producing operand 0 / answer
+None) while a question is being generated.
+
+Every row is checked for:
+  * an `operands` spec that parses, with one range per variable, and a
+    `constraint` (if given) those ranges can meet,
+  * `question` / `equation` placeholders that name defined variables,
+  * an `equation` that is plain arithmetic over those variables
+    (question/equation.py),
+  * translated `question_*` templates with undefined placeholders
+    (a warning only: the English template is used instead).
+
+Rows with errors are dropped from the bank; the full list is written to
+`<workbook>.report.json` next to the workbook.
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from question.cells import PLACEHOLDER, is_blank
+from question.equation import EquationError, compile_equation
+from question.operands import OperandError, parse_operands
+
+ERROR   = "error"
+WARNING = "warning"
+
+
+# ── Field validators ─────────────────────────────────────────────────────────
+
+def validate_operands(spec, constraint=None) -> tuple[list[str], str | None]:
+    """
+    Compile an operand spec such as `a1:10*b5;1:9*c1,2,3`, with its
+    optional constraint (see question/operands.py). Returns the variable
+    names and an error message (None when valid).
+    """
+    try:
+        return list(parse_operands(spec, constraint).variables), None
+    except OperandError as e:
+        return [], str(e)
+
+
+def validate_template(text, variables, column="question") -> str | None:
+    if is_blank(text):
+        return f"empty {column}"
+    unknown = set(PLACEHOLDER.findall(str(text))) - set(variables)
+    if unknown:
+        return f"{column} uses undefined {', '.join(sorted(unknown))}"
+    return None
+
+
+def validate_equation(equation, variables) -> str | None:
+    error = validate_template(equation, variables, column="equation")
+    if error:
+        return error
+    try:
+        compile_equation(equation, variables)
+    except EquationError as e:
+        return str(e)
+    return None
+
+
+def validate_row(row: dict) -> str | None:
+    """First error that makes `row` unusable, or None."""
+    for column, severity, message in check_row(row):
+        if severity == ERROR:
+            return message
+    return None
+
+
+def check_row(row: dict, translations=()) -> list[tuple[str, str, str]]:
+    """All problems with one row as (column, severity, message) tuples."""
+    variables, error = validate_operands(row.get("operands"), row.get("constraint"))
+    if error:
+        return [("operands", ERROR, error)]
+
+    issues = []
+    error = validate_template(row.get("question"), variables)
+    if error:
+        issues.append(("question", ERROR, error))
+    error = validate_equation(row.get("equation"), variables)
+    if error:
+        issues.append(("equation", ERROR, error))
+    for column in translations:
+        text = row.get(column)
+        if is_blank(text):
+            continue
+        error = validate_template(text, variables, column=column)
+        if error:
+            issues.append((column, WARNING, error))
+    return issues
+
+
+# ── Whole-bank report ────────────────────────────────────────────────────────
+
+class BankReport:
+    """Result of checking every row of one workbook."""
+
+    def __init__(self, workbook: str, total: int, issues: list[dict]):
+        self.workbook = workbook
+        self.total    = total
+        self.issues   = issues
+
+    @property
+    def bad_rows(self) -> list[int]:
+        """Positions (0-based, in workbook order) of rows with errors."""
+        return sorted({i["position"] for i in self.issues if i["severity"] == ERROR})
+
+    def to_dict(self) -> dict:
+        dropped = len(self.bad_rows)
+        return {
+            "workbook": self.workbook,
+            "rows":     self.total,
+            "valid":    self.total - dropped,
+            "dropped":  dropped,
+            "issues":   [{k: v for k, v in i.items() if k != "position"}
+                         for i in self.issues],
+        }
+
+    def write(self, path: str):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+
+def report_path(workbook: str) -> str:
+    return os.path.splitext(workbook)[0] + ".report.json"
+
+
+def check_frame(df: pd.DataFrame, workbook: str = "") -> BankReport:
+    """
+    Check every row of a question frame read straight from its workbook,
+    so row N is spreadsheet line N + 2 (line 1 is the header).
+    """
+    translations = [c for c in df.columns if str(c).startswith("question_")]
+    has_id       = "id" in df.columns
+    issues = []
+    for position, row in enumerate(df.to_dict("records")):
+        for column, severity, message in check_row(row, translations):
+            issue = {"position": position, "line": position + 2}
+            if has_id and not is_blank(row["id"]):
+                issue["id"] = row["id"]
+            issue.update(column=column, severity=severity, message=message)
+            issues.append(issue)
+    return BankReport(os.path.basename(workbook), len(df), issues)
@@ -0,0 +1,58 @@
+"""question/deck.py
+
+Sampling rows without replacement.
+
+A `RowDeck` deals a pool of bank positions in random order, every row
+once before any row repeats. Each draw is one step of an incremental
+Fisher-Yates shuffle (swap a random undealt row into the cursor slot and
+advance), so it is O(1) however big the pool is, and starting the next
+round is just moving the cursor back to the front. Because the deck
+holds bank positions rather than indexes into a filtered view, what it
+has dealt stays meaningful when the filters in front of it change.
+"""
+
+MAX_TRIES = 8     # picks tried for a row the caller does not `avoid`
+
+
+class RowDeck:
+    __slots__ = ("_order", "_next", "_rng")
+
+    def __init__(self, rows, rng, dealt=()):
+        rows   = [int(r) for r in rows]
+        dealt  = {int(r) for r in dealt}    # already dealt this round, e.g. by a saved game
+        self._order = [r for r in rows if r in dealt] + [r for r in rows if r not in dealt]
+        self._next  = len(self._order) - sum(1 for r in rows if r not in dealt)
+        self._rng   = rng                  # random.Random of the owning session
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def remaining(self) -> int:
+        """Rows still to come in this round."""
+        return len(self._order) - self._next
+
+    def dealt(self) -> list:
+        """Rows dealt so far this round."""
+        return self._order[:self._next]
+
+    def draw(self, avoid=None) -> int:
+        """
+        The next bank position; a new round starts once every row was
+        dealt. With `avoid`, a predicate on bank positions, rows it rejects
+        are left in the deck and another is picked (up to MAX_TRIES picks;
+        the last one is dealt regardless).
+        """
+        order = self._order
+        if self._next == len(order):
+            self._next = 0
+        i, left = self._next, len(order) - self._next
+        j = i + self._rng.randrange(left)
+        if avoid is not None and left > 1:
+            for _ in range(MAX_TRIES - 1):
+                if not avoid(order[j]):
+                    break
+                j = i + self._rng.randrange(left)
+        order[i], order[j] = order[j], order[i]
+        self._next = i + 1
+        return order[i]
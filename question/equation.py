@@ -0,0 +1,140 @@
+"""question/equation.py
+
+Compiled answer equations.
+
+An `equation` cell such as `({a} + {b}) * {c}` used to be filled in as
+text and handed to `eval()`, so any workbook (including a teacher upload)
+could run arbitrary Python. Each cell is now parsed once with `ast`,
+checked against a small arithmetic whitelist:
+
+    numbers, + - * / // % (binary), + - (unary), ** with a constant
+    exponent (not nested), parentheses, and the row's {variables}
+
+and turned into a plain function of the operands, so working out an
+answer is one call with no parsing or string work. Anything else (names,
+calls, attributes, comparisons, ...) is an `EquationError` when the bank
+is compiled or the workbook is uploaded.
+"""
+
+import ast
+
+import numpy as np
+
+from question.cells import PLACEHOLDER, placeholder_slots
+
+MAX_EXPONENT = 64           # `x ** n` only for a literal n up to this
+
+_BINARY = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY  = (ast.UAdd, ast.USub)
+
+
+class EquationError(ValueError):
+    """An equation cell that is not plain arithmetic over the row's variables."""
+
+
+class Equation:
+    __slots__ = ("source", "variables", "_fn")
+
+    def __init__(self, source: str, variables, fn):
+        self.source    = source
+        self.variables = tuple(variables)
+        self._fn       = fn
+
+    def evaluate(self, values):
+        """
+        The answer for `values` (one per variable, in spec order), or None
+        if there are too few values or the arithmetic fails (division by
+        zero, overflow), as the old `eval()` path returned.
+        """
+        if len(values) < len(self.variables):
+            return None
+        try:
+            return self._fn(*values[:len(self.variables)])
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+
+    def evaluate_many(self, values: np.ndarray) -> np.ndarray:
+        """
+        Answers for every row of an (n, variables) operand array, as
+        float64; NaN where `evaluate` would give None. The arithmetic runs
+        in floating point, so division by zero shows up as inf/NaN rather
+        than an exception.
+        """
+        n = len(values)
+        if values.ndim != 2 or values.shape[1] < len(self.variables):
+            return np.full(n, np.nan)
+        columns = values[:, :len(self.variables)].astype(np.float64).T
+        try:
+            with np.errstate(all="ignore"):
+                result = np.asarray(self._fn(*columns), dtype=np.float64)
+        except (ArithmeticError, ValueError, TypeError):
+            return np.full(n, np.nan)
+        result = np.broadcast_to(result, (n,)).copy()
+        result[~np.isfinite(result)] = np.nan
+        return result
+
+
+# ── Compiler ─────────────────────────────────────────────────────────────────
+
+def _check(node, names):
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _BINARY):
+            raise EquationError(f"operator {type(node.op).__name__} is not allowed")
+        if isinstance(node.op, ast.Pow):
+            exponent = node.right
+            if not (isinstance(exponent, ast.Constant)
+                    and type(exponent.value) in (int, float)
+                    and abs(exponent.value) <= MAX_EXPONENT):
+                raise EquationError(f"** needs a number up to {MAX_EXPONENT} as exponent")
+            if any(isinstance(n, ast.BinOp) and isinstance(n.op, ast.Pow)
+                   for n in ast.walk(node.left)):
+                raise EquationError("** cannot be nested")
+        _check(node.left, names)
+        _check(node.right, names)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY):
+            raise EquationError(f"operator {type(node.op).__name__} is not allowed")
+        _check(node.operand, names)
+    elif isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            raise EquationError(f"{node.value!r} is not a number")
+    elif isinstance(node, ast.Name):
+        if node.id not in names:
+            raise EquationError(f"{node.id!r} is not one of the row's variables")
+    else:
+        raise EquationError(f"{type(node).__name__} is not allowed")
+
+
+def compile_equation(text: str, variables) -> Equation:
+    """Compile one `equation` cell; raises EquationError if it is not allowed."""
+    source = str(text).strip().replace("×", "*")
+    slot_of = placeholder_slots(variables)
+
+    def slot(m):
+        i = slot_of.get(m.group(1))
+        if i is None:
+            raise EquationError(f"equation uses undefined {m.group(1)}")
+        return f"(_{i})"
+
+    expr = PLACEHOLDER.sub(slot, source)
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        raise EquationError(f"equation {source!r} does not parse") from None
+
+    args = [f"_{i}" for i in range(len(variables))]
+    try:
+        _check(tree.body, set(args))
+    except EquationError as e:
+        raise EquationError(f"{e} in {source!r}") from None
+
+    # The checked tree becomes the body of `lambda _0, _1, ...: <expr>`;
+    # it can only reach its arguments, so there are no builtins to hand it.
+    fn = ast.Expression(ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(a) for a in args],
+                           kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=tree.body,
+    ))
+    ast.fix_missing_locations(fn)
+    code = compile(fn, "<equation>", "eval")
+    return Equation(source, variables, eval(code, {"__builtins__": {}}))
@@ -0,0 +1,186 @@
+"""question/importer.py
+
+Streaming import for teacher-uploaded question workbooks.
+
+The workbook is read row by row with openpyxl's read-only mode on a
+worker thread, each row is checked as it goes with the same rules as
+the built-in banks (question/compiler.py), and the valid rows become an
+in-memory `QuestionBank` the uploaded quiz draws from. Bad rows are skipped and
+reported with their spreadsheet row number instead of failing the
+whole upload.
+"""
+
+import os
+import threading
+from time import perf_counter
+
+import pandas as pd
+from openpyxl import load_workbook
+from PyQt5.QtCore import QObject, Qt, QThread, pyqtSignal
+
+from question.bank import QuestionBank
+from question.cells import is_blank
+from question.compiler import validate_row
+
+REQUIRED_COLUMNS = ("question", "operands", "equation")
+PROGRESS_EVERY   = 200          # rows between progress signals
+
+
+class WorkbookError(Exception):
+    """The workbook as a whole cannot be imported (not a row problem)."""
+
+
+# ── Streaming reader ─────────────────────────────────────────────────────────
+
+class ImportResult:
+    def __init__(self, bank, total_rows, errors, seconds):
+        self.bank       = bank
+        self.total_rows = total_rows
+        self.errors     = errors          # [(spreadsheet row number, message)]
+        self.seconds    = seconds
+
+    @property
+    def valid_rows(self) -> int:
+        return len(self.bank)
+
+
+def import_workbook(path: str, progress=None, cancelled=lambda: False) -> ImportResult | None:
+    """
+    Stream `path` into a QuestionBank named "uploaded". `progress(done,
+    total)` is called every PROGRESS_EVERY rows; `total` is 0 when the
+    sheet does not record its size. Returns None if `cancelled()` turns
+    true part-way.
+    """
+    start = perf_counter()
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws    = wb.worksheets[0]
+        rows  = ws.iter_rows(values_only=True)
+        total = max((ws.max_row or 1) - 1, 0)
+
+        header = next(rows, None) or ()
+        header = [str(h).strip() if h is not None else "" for h in header]
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise WorkbookError(
+                "Excel must have columns titled: " + ", ".join(REQUIRED_COLUMNS)
+            )
+
+        width  = len(header)
+        kept   = []
+        errors = []
+        done   = 0
+        for line, values in enumerate(rows, start=2):
+            done += 1
+            if done % PROGRESS_EVERY == 0:
+                if cancelled():
+                    return None
+                if progress:
+                    progress(done, total)
+
+            values = tuple(values[:width]) + (None,) * (width - len(values))
+            if all(is_blank(v) for v in values):
+                continue
+            record = dict(zip(header, values))
+            error  = validate_row(record)
+            if error:
+                errors.append((line, error))
+            else:
+                kept.append(values)
+    finally:
+        wb.close()
+
+    if progress:
+        progress(done, total or done)
+
+    df = pd.DataFrame(kept, columns=header)
+    df = df.loc[:, [c for c in df.columns if c]]
+    st = os.stat(path)
+    bank = QuestionBank("uploaded", path, df, (st.st_mtime_ns, st.st_size))
+    bank.index
+    return ImportResult(bank, done, errors, perf_counter() - start)
+
+
+# ── Worker thread ────────────────────────────────────────────────────────────
+
+class ImportWorker(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)      # ImportResult
+    failed   = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, path):
+        super().__init__()
+        self.path       = path
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """
+        Stop the import. Safe from any thread; connect it with
+        Qt.DirectConnection (start_import does), since a queued call would
+        wait for run() to return on the busy import thread.
+        """
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self):
+        try:
+            result = import_workbook(self.path, progress=self.progress.emit,
+                                     cancelled=self._cancelled.is_set)
+        except WorkbookError as e:
+            self.failed.emit(str(e))
+            return
+        except Exception as e:
+            self.failed.emit(f"Could not read {os.path.basename(self.path)}: {e}")
+            return
+        if result is None or self.is_cancelled:
+            self.cancelled.emit()
+        else:
+            self.finished.emit(result)
+
+
+def import_running(owner) -> bool:
+    """True while `owner`'s last import thread has not finished."""
+    thread, _ = getattr(owner, "_excel_import", (None, None))
+    return thread is not None and thread.isRunning()
+
+
+def start_import(path, owner, progress=None, finished=None, failed=None,
+                 cancelled=None, cancel=None):
+    """
+    Run an ImportWorker for `path` on its own QThread, with the given
+    callbacks connected before it starts. `cancel` is a signal (e.g. a
+    progress dialog's `canceled`) that stops the import; `finished` is
+    not called once it has fired, even if the last rows were already
+    read. `owner` keeps thread and worker alive until the import ends,
+    and runs one import at a time: returns None, starting nothing, while
+    its previous one is still running.
+    """
+    if import_running(owner):
+        return None
+
+    thread = QThread()
+    worker = ImportWorker(path)
+    worker.moveToThread(thread)
+
+    if progress:
+        worker.progress.connect(progress)
+    if failed:
+        worker.failed.connect(failed)
+    if cancelled:
+        worker.cancelled.connect(cancelled)
+    if finished:
+        worker.finished.connect(
+            lambda result: None if worker.is_cancelled else finished(result))
+    if cancel is not None:
+        cancel.connect(worker.cancel, Qt.DirectConnection)
+
+    thread.started.connect(worker.run)
+    for signal in (worker.finished, worker.failed, worker.cancelled):
+        signal.connect(thread.quit)
+    owner._excel_import = (thread, worker)
+    thread.start()
+    return worker
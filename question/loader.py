@@ -1,8 +1,13 @@
-import os
-import re
 import random
-import pandas as pd
+from collections import deque
+
 import language.language as lang_config
+from question.bank import get_bank, language_column
+from question.batch import generate_batch
+from question.buckets import TIER2_SKILLS, bucket_plan
+from question.deck import RowDeck
+from question.recent import MAX_REDRAWS, RecentQuestions
+from question.record import NO_QUESTION, Question
 
 
 # Bridge question generator (under development - stub returns empty list)
@@ -11,7 +16,7 @@ def generate_bridge_questions(concept: str) -> list[dict]:
     return []
 
 # Concept lookup helper
-def get_concept_for_row(row: pd.Series) -> str:
+def get_concept_for_row(row) -> str:
     t = str(row.get('type', '')).strip().lower()
     if t in ('addition', 'subtraction', 'multiplication', 'division',
              'story', 'time', 'currency', 'mixed'):
@@ -19,21 +24,72 @@ def get_concept_for_row(row: pd.Series) -> str:
     return 'unknown'
 
 
-# Tier-2 skill list
-TIER2_SKILLS = ["story", "time", "currency"]
+# Seeded random streams
+def make_rng(seed=None) -> tuple[int, random.Random]:
+    """
+    A session's random stream and the seed that reproduces it. With the
+    same seed (and the same answers) a session draws the same questions.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    return seed, random.Random(seed)
+
+
+# Drawing one question
+def draw_question(bank, position: int, rng, recent: RecentQuestions) -> Question:
+    """
+    Row `position` of `bank` filled in with freshly drawn operands. Draws
+    that would repeat a question in `recent` are retried (bounded); the
+    text uses the active language's template, falling back to `question`.
+    """
+    position = int(position)
+    spec     = bank.operand_spec(position)
+    source   = bank.column("question")[position]
+    for _ in range(MAX_REDRAWS):
+        operands = spec.draw(rng)
+        key      = RecentQuestions.key(source, operands)
+        if key not in recent:
+            break
+    recent.add(key)
+
+    # The bank only holds the active language's column (plus English);
+    # a file or row without that translation falls back to `question`
+    column   = language_column(getattr(lang_config, 'selected_language', 'English'))
+    template = None
+    if column is not None and bank.get_column(column) is not None:
+        template = bank.template(position, column)
+    if template is None:
+        template = bank.template(position, "question")
+    text = template.render(operands) if template is not None else str(source)
+
+    equation = bank.equation(position)
+    answer   = equation.evaluate(operands) if equation is not None else None
+    try:
+        answer = round(float(answer)) if answer is not None else None
+    except (TypeError, ValueError, OverflowError):
+        answer = None
+
+    labels, types, digits = (bank.get_column(c) for c in ("label", "type", "_digit_int"))
+    return Question(
+        text     = text,
+        answer   = answer,
+        operands = tuple(operands),
+        row      = position,
+        label    = str(labels[position]).strip() if labels is not None else "",
+        skill    = str(types[position]).strip().lower() if types is not None else "",
+        digits   = int(digits[position]) if digits is not None else 1,
+    )
 
 
 # QuestionProcessor
 class QuestionProcessor:
     def __init__(self, questionType, difficultyIndex, disable_dda=False,
-                 is_game_mode=False, preloaded_df=None):
+                 is_game_mode=False, view=None, seed=None, rng=None, recent=None):
         self.questionType           = questionType
         self.widget                 = None
         self.difficultyIndex        = difficultyIndex
-        self.df                     = None
-        self.variables              = []
-        self.oprands                = []
-        self.rowIndex               = 0
+        self.view                   = None   # BankView of the rows to draw from
+        self.bank                   = None   # the bank version this processor draws from
         self.retry_count            = 0
         self.total_attempts         = 0
         self.correct_answers        = 0
@@ -41,16 +97,35 @@ class QuestionProcessor:
         self.incorrect_streak       = 0
         self.current_performance_rate = 0
         self.current_difficulty     = difficultyIndex
-        self._used_rows             = set()
+        self._pools                 = {}     # (digit gate, strict label) -> (rows, RowDeck) for self.view
+        self._pools_view            = None
+        self._view_key              = None
         self.disable_dda            = disable_dda
         self.is_game_mode           = is_game_mode
         self.max_digit_level        = None
         self._skip_process_file     = False
 
-        if preloaded_df is not None:
-            self.df                 = preloaded_df.reset_index(drop=True)
+        # Sessions pass their own stream so all their processors share it
+        if rng is not None:
+            self.seed, self.rng = seed, rng
+        else:
+            self.seed, self.rng = make_rng(seed)
+        self.recent = recent if recent is not None else RecentQuestions()
+
+        if view is not None:
+            self.view               = view
+            self.bank               = view.bank
             self._skip_process_file = True
 
+    def _bank(self):
+        """
+        The bank this processor was built with, fetched on first use and
+        then kept: a reload only reaches processors created after it.
+        """
+        if self.bank is None:
+            self.bank = get_bank("game" if self.is_game_mode else "learning")
+        return self.bank
+
     #File loading
     def get_questions(self):
         if not self._skip_process_file:
@@ -58,221 +133,114 @@ class QuestionProcessor:
         return self.get_random_question()
 
     def process_file(self):
+        bank       = self._bank()
+        difficulty = self.difficultyIndex
+        key = (bank, self.questionType,
+               tuple(difficulty) if isinstance(difficulty, list) else difficulty)
+        if self.view is not None and key == self._view_key:
+            return          # same rows as last time: keep the view and its deck
+        self._view_key = key
+
         if self.is_game_mode:
-            file_path = os.path.join(os.getcwd(), "question", "game_ques.xlsx")
-            print(f"[Processor] Game file: {file_path}")
-
-            df = pd.read_excel(file_path)
-            df["type"]       = df["type"].astype(str).str.strip().str.lower()
-            df["digits"]     = df["digits"].astype(str).str.strip().str.lower()
-            df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce").fillna(0).astype(int)
-            df["label"]      = df["label"].astype(str).str.strip()
-
-            if "digits" in df.columns:
-                df["_digit_int"] = (
-                    df["digits"]
-                    .str.extract(r'(\d+)', expand=False)
-                    .pipe(pd.to_numeric, errors="coerce")
-                    .fillna(1).astype(int)
-                )
-            else:
-                df["_digit_int"] = 1
-
-            valid_difficulties = (
-                self.difficultyIndex if isinstance(self.difficultyIndex, list)
-                else [self.difficultyIndex]
-            )
-            q_type   = self.questionType.lower().strip()
-            level_df = df[df["difficulty"].isin(valid_difficulties)]
-            typed_df = level_df[level_df["type"] == q_type]
-
-            if not typed_df.empty:
-                self.df = typed_df.reset_index(drop=True)
-            elif not level_df.empty:
-                self.df = level_df.reset_index(drop=True)
+            q_type     = self.questionType.lower().strip()
+            level_rows = bank.rows(difficulty=self.difficultyIndex)
+            typed_rows = bank.rows(type=q_type, difficulty=self.difficultyIndex)
+
+            if len(typed_rows):
+                self.view = bank.view(typed_rows)
+            elif len(level_rows):
+                self.view = bank.view(level_rows)
             else:
-                self.df = df.reset_index(drop=True)
+                self.view = bank.view()
             return
 
         #learning mode
-        file_path = os.path.join(os.getcwd(), "question", "question.xlsx")
-        print(f"[Processor] Learning file: {file_path}")
-
-        df = pd.read_excel(file_path)
-
         if self.questionType == "custom":
-            self.df = df
+            self.view = bank.view()
             return
 
-        df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce")
-        df["type"]       = df["type"].astype(str).str.strip().str.lower()
-
-        valid_difficulties = (
-            self.difficultyIndex if isinstance(self.difficultyIndex, list)
-            else [self.difficultyIndex]
-        )
-        filtered = df[
-            (df["type"] == self.questionType.lower().strip())
-            & (df["difficulty"].isin(valid_difficulties))
-        ]
-        self.df = filtered.sort_values("difficulty", ascending=True).reset_index(drop=True)
-
-    def quickplay(self):
-        self.process_for_quickplay()
-        return self.get_random_question()
-
-    def process_for_quickplay(self):
-        file_path = os.path.join(os.getcwd(), "question", "question.xlsx")
-        df = pd.read_excel(file_path)
-        df["type"]       = df["type"].astype(str).str.strip().str.lower()
-        df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce")
-        valid_difficulties = (
-            self.difficultyIndex if isinstance(self.difficultyIndex, list)
-            else [self.difficultyIndex]
-        )
-        df = df[df["difficulty"].isin(valid_difficulties)]
-        self.df = df.sample(frac=1).reset_index(drop=True)
-
-    # Question selection 
-    def get_random_question(self):
-        if self.df is None or self.df.empty:
-            return "No questions found.", None
-
-        working_df = self.df
+        # rows come back ordered by difficulty
+        rows    = bank.rows(type=self.questionType.lower().strip(),
+                            difficulty=self.difficultyIndex)
+        self.view = bank.view(rows)
+
+    # Question selection
+    def _pool(self):
+        """
+        The rows questions are drawn from (the view after the digit gate) and
+        their deck, built once per view and digit level and kept, so
+        returning to a level carries on where its deck left off.
+        """
+        if self._pools_view is not self.view:
+            self._pools      = {}           # a new view: the old decks are for other rows
+            self._pools_view = self.view
+        pool = self._pools.get(self.max_digit_level)
+        if pool is None:
+            working = self._gated_view()
+            pool = self._pools[self.max_digit_level] = (working, RowDeck(working.rows, self.rng))
+        return pool
+
+    def _gated_view(self):
+        """`self.view` narrowed by the digit gate, if that leaves any rows."""
+        working = self.view
 
         if (
             self.is_game_mode
             and self.max_digit_level is not None
-            and "_digit_int" in self.df.columns
+            and "_digit_int" in working.columns
         ):
-            gated = self.df[self.df["_digit_int"] <= self.max_digit_level]
+            gated = working.where(working.column("_digit_int") <= self.max_digit_level)
             if not gated.empty:
-                working_df = gated
+                working = gated
+        return working
 
-        if getattr(self, "strict_label", None):
-            strict_filtered = working_df[working_df["label"].astype(str).str.strip() == self.strict_label]
-            if not strict_filtered.empty:
-                working_df = strict_filtered.reset_index(drop=True)
-
-        all_rows = list(range(len(working_df)))
-
-        if self.is_game_mode:
-            local_idx = random.choice(all_rows)
-        else:
-            available = [r for r in all_rows if r not in self._used_rows]
-            if not available:
-                self._used_rows = set()
-                available = all_rows
-            local_idx = random.choice(available)
-            self._used_rows.add(local_idx)
-
-        row = working_df.iloc[local_idx]
-        self.rowIndex = local_idx
-
-        selected_question_label = str(row.get("label", "")).strip()
-
-        if getattr(self, "strict_label", None):
-            assert selected_question_label == self.strict_label, \
-                f"Label mismatch constraint violated. Expected: {self.strict_label}, Got: {selected_question_label}"
-
-        variable_string = str(row["operands"])
-        input_string    = ''.join(c for c in variable_string if not c.isalpha())
-        self.variables  = [c for c in variable_string if c.isalpha()]
-        self.oprands    = self.parseInputRange(input_string)
-
-        # ── Marathi Integration (Handles both Learning & Game Mode) ──
-        current_lang = getattr(lang_config, 'selected_language', 'English')
-        
-        # We check working_df.columns to see if the translation exists in the current file
-        if current_lang == "हिंदी" and "question_hi" in working_df.columns:
-            question_template = str(row["question_hi"])
-        elif current_lang == "മലയാളം" and "question_mal" in working_df.columns:
-            question_template = str(row["question_mal"])
-        elif current_lang == "मराठी" and "question_marathi" in working_df.columns:
-            question_template = str(row["question_marathi"])
-        else:
-            question_template = str(row["question"])
-
-        if question_template in ("nan", "None", ""):
-            question_template = str(row["question"])
+    def get_random_question(self):
+        question = self.random_question()
+        return question.text, question.answer
 
-        for i, var in enumerate(self.variables):
-            if i < len(self.oprands):
-                question_template = question_template.replace(f"{{{var}}}", str(self.oprands[i]))
-        # ─────────────────────────────────────────────────────────────
+    def next_question(self) -> Question:
+        """`get_questions`, as a Question record."""
+        if not self._skip_process_file:
+            self.process_file()
+        return self.random_question()
 
-        self._working_df = working_df
-        self.extractAnswer()
+    def random_question(self) -> Question:
+        if self.view is None or self.view.empty:
+            return Question(NO_QUESTION, None)
 
-        try:
-            answer = round(float(self.Pr_answer)) if self.Pr_answer is not None else None
-        except (TypeError, ValueError):
-            answer = None
+        working, deck = self._pool()
 
-        return question_template, answer
+        # Game mode draws with replacement; learning mode deals every row once before repeats
+        if self.is_game_mode:
+            position = working.rows[self.rng.randrange(len(working))]
+        else:
+            position = deck.draw()
+
+        return draw_question(working.bank, position, self.rng, self.recent)
+
+    def generate_batch(self, n: int, seed=None):
+        """
+        `n` questions from the same rows `get_random_question` would use,
+        generated in bulk (question/batch.py): returns (texts, answers).
+        Rows are drawn with replacement and the deck is left alone.
+        Without a `seed` the batch is seeded from the processor's stream.
+        """
+        if self.view is None and not self._skip_process_file:
+            self.process_file()
+        if self.view is None or self.view.empty:
+            return [], []
+        if seed is None:
+            seed = self.rng.randrange(2 ** 32)
+        column = language_column(getattr(lang_config, 'selected_language', 'English'))
+        return generate_batch(self._pool()[0], n, seed, column)
 
     #Answer handling
-    def extractAnswer(self):
-        answer_equation = self.getAnswer(self.rowIndex, "equation")
-        self.Pr_answer  = str(self.solveEquation(answer_equation))
-
-    def getAnswer(self, row_idx: int, column: str) -> str:
-        df = getattr(self, '_working_df', self.df)
-        if df is None or df.empty:
-            return "0"
-        row_idx      = min(row_idx, len(df) - 1)
-        ans_equation = str(df.iloc[row_idx][column])
-        ans_equation = ans_equation.replace("×", "*")
-        for i in range(len(self.variables)):
-            if i < len(self.oprands):
-                ans_equation = ans_equation.replace(f"{{{self.variables[i]}}}", str(self.oprands[i]))
-        return ans_equation
-
-    def solveEquation(self, ans_equation: str):
-        try:
-            return eval(ans_equation)
-        except Exception:
-            return None
-
-    def parseInputRange(self, inputRange: str) -> list[int]:
-        operands = []
-        current  = ""
-        for c in inputRange:
-            if c == "*":
-                operands.append(int(self.extractType(current)))
-                current = ""
-            else:
-                current += c
-        if current:
-            operands.append(int(self.extractType(current)))
-        return operands
-
-    def extractType(self, inputRange: str):
-        try:
-            if "," in inputRange:
-                return random.choice(list(map(int, inputRange.split(","))))
-            elif ";" in inputRange:
-                parts  = inputRange.split(";")
-                base   = int(parts[0])
-                if ":" in parts[1]:
-                    min_val, max_val = map(int, parts[1].split(":"))
-                    result = base * random.randint(min_val, max_val)
-                else:
-                    result = base * int(parts[1])
-                return result if result != 0 else base
-            elif ":" in inputRange:
-                a, b = map(int, inputRange.split(":"))
-                return random.randint(a, b)
-            return int(inputRange)
-        except Exception:
-            return 0
-
-    def submit_answer(self, user_answer, correct_answer, time_taken, replay_count=0):
+    def submit_answer(self, user_answer, question: Question, time_taken, replay_count=0):
         if user_answer is None or str(user_answer).strip() == "":
             return {"valid": False}
         try:
             user_val    = float(user_answer)
-            correct_val = float(correct_answer)
+            correct_val = float(question.answer)
         except (ValueError, TypeError):
             return {"valid": False}
 
@@ -323,23 +291,22 @@ class QuestionProcessor:
 class LinearProgressionSession:
     MAX_QUESTIONS = 20
 
-    def __init__(self, difficulty_index: int):
+    def __init__(self, difficulty_index: int, seed=None):
         self.max_level = 3
 
+        # Every row pick and operand draw in the session comes from this stream
+        self.seed, self.rng = make_rng(seed)
+        print(f"[SESSION] linear progression seed={self.seed}")
+        self.recent = RecentQuestions()
+
         self.level_index      = max(0, min(difficulty_index - 1, self.max_level))
         self.difficulty_index = self.level_index
 
         import time as _time
         self.session_start_time = _time.time()
 
-        #Load Excel 
-        file_path = os.path.join(os.getcwd(), "question", "game_ques.xlsx")
-        full_df   = pd.read_excel(file_path)
-        full_df["type"]       = full_df["type"].astype(str).str.strip().str.lower()
-        full_df["digits"]     = full_df["digits"].astype(str).str.strip().str.lower()
-        full_df["label"]      = full_df["label"].astype(str).str.strip()
-        full_df["difficulty"] = pd.to_numeric(full_df["difficulty"], errors="coerce").fillna(0).astype(int)
-        self.full_df = full_df
+        #Shared question bank
+        self.bank = get_bank("game")
 
         self.tier2_skills     = TIER2_SKILLS
         self.user_time_factor = 1.0
@@ -368,59 +335,20 @@ class LinearProgressionSession:
         self._bridge_queue: list[dict] = []
         self._is_bridge = False
 
-        self._build_buckets()
+        self._enter_level()
         self.processors = {}
 
-    #Bucket construction
-    def _build_buckets(self):
-        level_df = self.full_df[self.full_df["difficulty"] == self.level_index].copy()
-        if level_df.empty:
-            level_df = self.full_df[self.full_df["difficulty"] == 0].copy()
-        if level_df.empty:
-            level_df = self.full_df.copy()
-
-        main_df = level_df[~level_df["type"].isin(self.tier2_skills)].copy()
-
-        def extract_digit(raw):
-            m = re.search(r'(\d+)', str(raw))
-            return int(m.group(1)) if m else 1
+    #Buckets
+    def _enter_level(self):
+        """Switch to the current level's precomputed buckets, starting at the first."""
+        level = bucket_plan(self.bank).level(self.level_index)
+        self.buckets        = level.labels
+        self.bucket_to_rows = level.rows
+        print(f"[BUCKET ORDER] difficulty={self.level_index}, labels: {list(self.buckets)}")
 
-        main_df["_digit_int"] = main_df["digits"].apply(extract_digit)
-        main_df["label"]      = main_df["label"].astype(str).str.strip()
-        self.main_df = main_df
-
-        self.buckets        = []
-        self.bucket_to_rows = {}
-
-        unique_labels = main_df["label"].unique()
-
-        op_order       = {"addition": 0, "subtraction": 1, "multiplication": 2, "division": 3}
-        label_sort_keys = {}
-        for lbl in unique_labels:
-            if not lbl or lbl == "nan" or lbl == "None":
-                continue
-            lbl_df      = main_df[main_df["label"] == lbl]
-            first_type  = str(lbl_df["type"].iloc[0]).strip().lower()
-            first_digit = int(lbl_df["_digit_int"].iloc[0])
-            label_sort_keys[lbl] = (op_order.get(first_type, 99), first_digit)
-
-        valid_labels = [lbl for lbl in unique_labels if lbl and lbl != "nan" and lbl != "None"]
-        valid_labels.sort(key=lambda lbl: label_sort_keys[lbl])
-
-        for lbl in valid_labels:
-            if lbl not in self.buckets:
-                self.buckets.append(lbl)
-                self.bucket_to_rows[lbl] = list(main_df[main_df["label"] == lbl].index)
-
-        print(f"[BUCKET ORDER] difficulty={self.level_index}, labels: {self.buckets}")
-
-        if not self.buckets:
-            self.buckets = ["fallback"]
-            self.bucket_to_rows = {"fallback": list(self.full_df.index)[:10]}
-
-        self.bucket_index   = 0
-        self.used_questions = {b: set() for b in self.buckets}
-        self.recent_patterns = []
+        self.bucket_index    = 0
+        self.decks           = {}        # label -> RowDeck, dealt on first visit
+        self.recent_patterns = deque(maxlen=1)
 
     #Helpers
     def _get_bucket_label(self, b_idx: int) -> str:
@@ -445,39 +373,41 @@ class LinearProgressionSession:
         key = (skill, difficulty)
 
         def _filtered(diff):
-            df_slice = self.full_df[
-                (self.full_df["difficulty"] == diff)
-                & (self.full_df["type"] == skill.lower())
-            ].copy()
-            if df_slice.empty:
-                df_slice = self.full_df[self.full_df["type"] == skill.lower()].copy()
-            if "_digit_int" not in df_slice.columns:
-                df_slice["_digit_int"] = df_slice["digits"].apply(
-                    lambda raw: int(re.search(r'(\d+)', str(raw)).group(1))
-                    if re.search(r'(\d+)', str(raw)) else 1
-                )
-            return df_slice.reset_index(drop=True)
+            rows = self.bank.rows(type=skill.lower(), difficulty=diff)
+            if not len(rows):
+                rows = self.bank.rows(type=skill.lower())
+            return self.bank.view(rows)
 
         if key not in self.processors:
             p = QuestionProcessor(skill, difficulty, disable_dda=True, is_game_mode=True,
-                                  preloaded_df=_filtered(difficulty))
+                                  view=_filtered(difficulty), seed=self.seed, rng=self.rng,
+                                  recent=self.recent)
             self.processors[key] = p
         else:
             p = self.processors[key]
             if p.difficultyIndex != difficulty:
                 p.difficultyIndex = difficulty
-                p.df = _filtered(difficulty)
+                p.view = _filtered(difficulty)
         return p
 
     #Question delivery
 
-    def get_next_question(self):
-        """Return either a bridge dict or a QuestionProcessor."""
+    def questions(self):
+        """
+        The session's questions, drawn lazily from the shared bank until
+        it is complete. Submit each answer before asking for the next one;
+        the levels and buckets follow the answers.
+        """
+        while not self.is_session_complete():
+            yield self.next_question()
+
+    def next_question(self) -> Question:
         if self._bridge_queue:
             bridge_q        = self._bridge_queue.pop(0)
             self._is_bridge = True
             self.question_count += 1
-            return bridge_q
+            return Question(str(bridge_q.get("question", "")), bridge_q.get("answer"),
+                            skill=str(bridge_q.get("type", "")).strip().lower())
 
         self._is_bridge = False
         self.question_count += 1
@@ -488,50 +418,35 @@ class LinearProgressionSession:
             and self.wrong_streak == 0
             and self.questions_in_current_concept >= 3
             and not self._recently_interleaved
-            and random.random() < 0.20
+            and self.rng.random() < 0.20
         ):
-            t2 = random.choice(self.tier2_skills)
+            t2 = self.rng.choice(self.tier2_skills)
             self.current_skill         = t2
             p  = self._get_tier2_processor(t2, self.level_index)
-            self.current_processor     = p
             self._is_tier2_interleave  = True
             self._recently_interleaved = True
-            return p
+            return p.random_question()
 
         self._is_tier2_interleave = False
 
         self.bucket_index  = max(0, min(self.bucket_index, len(self.buckets) - 1))
         self.current_label = str(self.buckets[self.bucket_index])
 
-        available_rows = [r for r in self.bucket_to_rows[self.current_label]
-                          if r not in self.used_questions[self.current_label]]
-        if not available_rows:
-            self.used_questions[self.current_label].clear()
-            available_rows = list(self.bucket_to_rows[self.current_label])
-
-        valid_rows = []
-        for r in available_rows:
-            try:
-                pattern = str(self.main_df.loc[r, "operands"]).strip()
-                if pattern not in self.recent_patterns[-1:]:
-                    valid_rows.append(r)
-            except KeyError:
-                valid_rows.append(r)
-        if not valid_rows:
-            valid_rows = available_rows
-
-        chosen_row_index = random.choice(valid_rows) if valid_rows else self.bucket_to_rows[self.current_label][0]
-        self.used_questions[self.current_label].add(chosen_row_index)
+        # Each bucket's rows come round once before repeating, avoiding the last operand pattern
+        deck = self.decks.get(self.current_label)
+        if deck is None:
+            deck = self.decks[self.current_label] = RowDeck(
+                self.bucket_to_rows[self.current_label], self.rng)
 
-        try:
-             self.recent_patterns.append(str(self.main_df.loc[chosen_row_index, "operands"]).strip())
-        except KeyError:
-             self.recent_patterns.append("N/A")
+        operands = self.bank.column("operands")
+        chosen_row_index = deck.draw(
+            lambda r: str(operands[r]).strip() in self.recent_patterns)
+        self.recent_patterns.append(str(operands[chosen_row_index]).strip())
 
-        row_data          = self.main_df.loc[chosen_row_index]
-        self.current_skill  = str(row_data.get("type", "addition")).strip().lower()
-        self.current_digits = int(row_data.get("_digit_int", 1))
-        self.current_concept = get_concept_for_row(row_data)
+        question = draw_question(self.bank, chosen_row_index, self.rng, self.recent)
+        self.current_skill   = question.skill or "addition"
+        self.current_digits  = question.digits
+        self.current_concept = get_concept_for_row({"type": question.skill})
 
         if self._current_concept_tracked != self.current_concept:
             self._current_concept_tracked     = self.current_concept
@@ -539,23 +454,12 @@ class LinearProgressionSession:
             self._recently_interleaved        = False
         else:
             self.questions_in_current_concept += 1
-
-        df_filtered = self.main_df[self.main_df["label"].str.strip() == self.current_label]
-
-        p = QuestionProcessor(self.current_skill, self.level_index,
-                              disable_dda=True, is_game_mode=True)
-        p.df               = df_filtered.copy().reset_index(drop=True)
-        p.strict_label     = self.current_label
-        p.rowIndex         = 0
-        p._used_rows       = set()
-        p._skip_process_file = True
-        self.current_processor = p
-        return p
+        return question
 
     #Answer submission
 
-    def submit_answer(self, skill_type: str, is_correct: bool, time_taken: float, replay_count: int = 0):
-        skill_type = str(skill_type).lower().strip()
+    def submit_answer(self, question: Question, is_correct: bool, time_taken: float, replay_count: int = 0):
+        skill_type = question.skill or "unknown"
         self.questions_answered += 1
 
         if skill_type not in self.skill_log:
@@ -574,8 +478,7 @@ class LinearProgressionSession:
             return
 
         #Speed classification
-        ideal     = self.get_ideal_time(getattr(self, "current_skill", skill_type),
-                                        getattr(self, "current_digits", 1))
+        ideal     = self.get_ideal_time(skill_type, question.digits)
         adjusted = ideal * self.user_time_factor
         if time_taken <= 0.8 * adjusted:  speed = "FAST"
         elif time_taken <= 1.5 * adjusted: speed = "NORMAL"
@@ -679,7 +582,7 @@ class LinearProgressionSession:
             if self.level_index > 0:
                 self.level_index      -= 1
                 self.difficulty_index  = self.level_index
-                self._build_buckets()
+                self._enter_level()
                 self._reset_streaks()
             else:
                 self.wrong_streak = 0
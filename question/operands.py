@@ -0,0 +1,366 @@
+"""question/operands.py
+
+Compiled operand specs.
+
+An `operands` cell such as `a1:10*b5;1:9*c1,2,3*` names one variable per
+letter and gives each a range, separated by `*`:
+
+    5         constant
+    1,2,3     one of the listed values
+    1:10      integer in [1, 10]
+    5;1:9     5 × an integer in [1, 9]  (5 if that product is 0)
+    5;3       5 × 3
+
+Each cell is parsed once into an `OperandSpec` (cached per row on the
+bank), so drawing a question's operands is a handful of RNG calls and no
+string work. `draw_many` draws a whole column of values per variable with
+a NumPy Generator for batch generation (question/batch.py).
+
+An optional `constraint` cell ties the first two variables together:
+
+    non_negative      first - second >= 0
+    exact_division    first / second is a whole number
+    carry             first + second carries in at least one column
+    no_carry          first + second carries in no column
+
+Both variables must be plain ranges or constants. Constrained pairs are
+built directly (e.g. divisor and quotient first, then the dividend) from
+tables worked out once per row, so a draw takes a fixed handful of
+steps instead of retrying until the pair happens to fit.
+"""
+
+import numpy as np
+
+from question.cells import is_blank
+
+
+class OperandError(ValueError):
+    """An operands cell that cannot be parsed."""
+
+
+# ── Nodes ────────────────────────────────────────────────────────────────────
+
+class Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def draw(self, rng) -> int:
+        return self.value
+
+    def draw_many(self, rng, n: int) -> np.ndarray:
+        return np.full(n, self.value, dtype=np.int64)
+
+
+class Choice:
+    __slots__ = ("values",)
+
+    def __init__(self, values):
+        self.values = tuple(values)
+
+    def draw(self, rng) -> int:
+        return rng.choice(self.values)
+
+    def draw_many(self, rng, n: int) -> np.ndarray:
+        return np.asarray(self.values, dtype=np.int64)[rng.integers(0, len(self.values), n)]
+
+
+class Range:
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo: int, hi: int):
+        self.lo, self.hi = lo, hi
+
+    def draw(self, rng) -> int:
+        return rng.randint(self.lo, self.hi)
+
+    def draw_many(self, rng, n: int) -> np.ndarray:
+        return rng.integers(self.lo, self.hi, n, endpoint=True)
+
+
+class ScaledRange:
+    __slots__ = ("base", "lo", "hi")
+
+    def __init__(self, base: int, lo: int, hi: int):
+        self.base, self.lo, self.hi = base, lo, hi
+
+    def draw(self, rng) -> int:
+        value = self.base * rng.randint(self.lo, self.hi)
+        return value if value != 0 else self.base
+
+    def draw_many(self, rng, n: int) -> np.ndarray:
+        values = self.base * rng.integers(self.lo, self.hi, n, endpoint=True)
+        values[values == 0] = self.base
+        return values
+
+
+# ── Constraints ──────────────────────────────────────────────────────────────
+
+MAX_CONSTRAINED_RANGE = 100_000     # values per constrained variable (5 digits)
+
+
+def _below(rng, n: int) -> int:
+    """Uniform integer in [0, n) from the random module, a random.Random or a numpy Generator."""
+    if hasattr(rng, "randrange"):
+        return rng.randrange(n)
+    return int(rng.integers(n))
+
+
+def _plain_bounds(node, name: str, non_negative=False) -> tuple[int, int]:
+    if isinstance(node, Range):
+        lo, hi = node.lo, node.hi
+    elif isinstance(node, Constant):
+        lo = hi = node.value
+    else:
+        raise OperandError(f"{name} needs plain ranges for its first two variables")
+    if non_negative and lo < 0:
+        raise OperandError(f"{name} needs non-negative ranges")
+    if hi - lo + 1 > MAX_CONSTRAINED_RANGE:
+        raise OperandError(f"range {lo}:{hi} is too large for {name}")
+    return lo, hi
+
+
+class NonNegative:
+    """first - second >= 0: draw the first, then the second from the part of its range below it."""
+
+    __slots__ = ("alo", "ahi", "blo", "bhi")
+
+    def __init__(self, first, second):
+        alo, self.ahi = _plain_bounds(first, "non_negative")
+        self.blo, self.bhi = _plain_bounds(second, "non_negative")
+        self.alo = max(alo, self.blo)
+        if self.alo > self.ahi:
+            raise OperandError("non_negative: the first variable is always below the second")
+
+    def draw(self, rng) -> tuple[int, int]:
+        a = self.alo + _below(rng, self.ahi - self.alo + 1)
+        b = self.blo + _below(rng, min(self.bhi, a) - self.blo + 1)
+        return a, b
+
+
+class ExactDivision:
+    """first / second is whole: draw a divisor and a quotient, the dividend is their product."""
+
+    __slots__ = ("divisors", "qlo", "qhi")
+
+    def __init__(self, first, second):
+        alo, ahi = _plain_bounds(first, "exact_division", non_negative=True)
+        blo, bhi = _plain_bounds(second, "exact_division", non_negative=True)
+        divisors = np.arange(max(blo, 1), bhi + 1, dtype=np.int64)
+        qlo, qhi = -(-alo // divisors), ahi // divisors
+        usable   = qlo <= qhi                 # some multiple of the divisor is in range
+        if not usable.any():
+            raise OperandError("exact_division: no divisor in range divides a value of the first")
+        self.divisors = divisors[usable].tolist()
+        self.qlo      = qlo[usable].tolist()
+        self.qhi      = qhi[usable].tolist()
+
+    def draw(self, rng) -> tuple[int, int]:
+        i = _below(rng, len(self.divisors))
+        q = self.qlo[i] + _below(rng, self.qhi[i] - self.qlo[i] + 1)
+        return q * self.divisors[i], self.divisors[i]
+
+
+def _blocks(caps) -> list[int]:
+    """blocks[i]: how many ways the digits below position i can stay within their caps."""
+    blocks, block = [], 1
+    for cap in caps:
+        blocks.append(block)
+        block *= cap + 1
+    return blocks
+
+
+def _box_count(caps, blocks, x: int) -> int:
+    """
+    How many y in [0, x] have every digit y_i <= caps[i] (caps least
+    significant first, x below 10 ** len(caps)).
+    """
+    if x < 0:
+        return 0
+    total = 0
+    for i in range(len(caps) - 1, -1, -1):
+        d = x // 10 ** i % 10
+        total += min(d, caps[i] + 1) * blocks[i]
+        if d > caps[i]:
+            return total
+    return total + 1
+
+
+def _box_counts(caps: np.ndarray, x: int) -> np.ndarray:
+    """`_box_count` for every row of an (n, width) caps array at once."""
+    n, width = caps.shape
+    if x < 0:
+        return np.zeros(n, dtype=np.int64)
+    blocks = np.cumprod(np.hstack([np.ones((n, 1), dtype=np.int64), caps[:, :-1] + 1]), axis=1)
+    total  = np.zeros(n, dtype=np.int64)
+    alive  = np.ones(n, dtype=bool)
+    for i in range(width - 1, -1, -1):
+        d = x // 10 ** i % 10
+        total += alive * np.minimum(d, caps[:, i] + 1) * blocks[:, i]
+        alive &= d <= caps[:, i]
+    return total + alive
+
+
+class ColumnCarry:
+    """
+    first + second with (`carry=True`) or without a carry in any column.
+    Adding carries exactly when some column's two digits sum past 9, so
+    for a given first operand the no-carry partners are the numbers whose
+    digits stay under `9 - digit`; they are counted and picked by rank
+    digit by digit, and carrying partners are the rest of the range.
+    """
+
+    __slots__ = ("carry", "width", "blo", "bhi", "firsts", "counts")
+
+    def __init__(self, first, second, carry: bool):
+        name = "carry" if carry else "no_carry"
+        alo, ahi = _plain_bounds(first, name, non_negative=True)
+        self.blo, self.bhi = _plain_bounds(second, name, non_negative=True)
+        self.carry = carry
+        self.width = len(str(max(ahi, self.bhi)))
+
+        firsts = np.arange(alo, ahi + 1, dtype=np.int64)
+        caps   = 9 - firsts[:, None] // 10 ** np.arange(self.width) % 10
+        counts = _box_counts(caps, self.bhi) - _box_counts(caps, self.blo - 1)
+        if carry:
+            counts = (self.bhi - self.blo + 1) - counts
+        usable = counts > 0
+        if not usable.any():
+            raise OperandError(f"{name}: no pair in these ranges")
+        self.firsts = firsts[usable].tolist()
+        self.counts = counts[usable].tolist()
+
+    def draw(self, rng) -> tuple[int, int]:
+        i    = _below(rng, len(self.firsts))
+        a    = self.firsts[i]
+        rank = _below(rng, self.counts[i])
+        caps   = [9 - a // 10 ** k % 10 for k in range(self.width)]
+        blocks = _blocks(caps)
+        base   = _box_count(caps, blocks, self.blo - 1)
+
+        if not self.carry:
+            # rank-th number in the digit box, counting from the bottom of the range
+            rank += base
+            b = 0
+            for k in range(self.width - 1, -1, -1):
+                digit, rank = divmod(rank, blocks[k])
+                b += digit * 10 ** k
+            return a, b
+
+        # rank-th number outside the box: the smallest x with rank + 1 of them in [blo, x]
+        lo, hi = self.blo, self.bhi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (mid - self.blo + 1) - (_box_count(caps, blocks, mid) - base) > rank:
+                hi = mid
+            else:
+                lo = mid + 1
+        return a, lo
+
+
+CONSTRAINTS = {
+    "non_negative":   NonNegative,
+    "exact_division": ExactDivision,
+    "carry":          lambda first, second: ColumnCarry(first, second, carry=True),
+    "no_carry":       lambda first, second: ColumnCarry(first, second, carry=False),
+}
+
+
+def _constraint_name(cell) -> str | None:
+    if is_blank(cell):
+        return None
+    return str(cell).strip().lower().replace("-", "_").replace(" ", "_")
+
+
+class OperandSpec:
+    """The compiled form of one `operands` cell (and its `constraint`, if any)."""
+
+    __slots__ = ("source", "variables", "nodes", "constraint")
+
+    def __init__(self, source: str, variables, nodes, constraint=None):
+        self.source     = source
+        self.variables  = tuple(variables)
+        self.nodes      = tuple(nodes)
+        self.constraint = constraint
+
+    def draw(self, rng) -> list[int]:
+        """One value per variable, drawn with `rng` (random.Random or the random module)."""
+        if self.constraint is None:
+            return [node.draw(rng) for node in self.nodes]
+        return [*self.constraint.draw(rng), *(node.draw(rng) for node in self.nodes[2:])]
+
+    def draw_many(self, rng, n: int) -> np.ndarray:
+        """An (n, variables) int64 array of draws from a numpy.random.Generator."""
+        if not self.nodes:
+            return np.empty((n, 0), dtype=np.int64)
+        if self.constraint is None:
+            return np.column_stack([node.draw_many(rng, n) for node in self.nodes])
+        pairs = np.array([self.constraint.draw(rng) for _ in range(n)],
+                         dtype=np.int64).reshape(n, 2)
+        return np.column_stack([pairs] + [node.draw_many(rng, n) for node in self.nodes[2:]])
+
+
+# ── Parser ───────────────────────────────────────────────────────────────────
+
+def _bounds(text: str) -> tuple[int, int]:
+    lo, hi = map(int, text.split(":"))
+    if lo > hi:
+        raise OperandError(f"empty range {text!r}")
+    return lo, hi
+
+
+def _parse_node(part: str):
+    try:
+        if "," in part:
+            return Choice(map(int, part.split(",")))
+        if ";" in part:
+            base, scale = part.split(";")[:2]      # extra ';' parts are ignored
+            base = int(base)
+            if ":" in scale:
+                return ScaledRange(base, *_bounds(scale))
+            value = base * int(scale)
+            return Constant(value if value != 0 else base)
+        if ":" in part:
+            return Range(*_bounds(part))
+        return Constant(int(part))
+    except OperandError:
+        raise
+    except ValueError:
+        raise OperandError(f"bad range {part!r}") from None
+
+
+def parse_operands(spec, constraint=None) -> OperandSpec:
+    """
+    Compile one `operands` cell and its optional `constraint` cell; raises
+    OperandError if either is malformed or the constraint cannot be met.
+    """
+    if is_blank(spec):
+        raise OperandError("empty operands")
+    spec      = str(spec).strip()
+    variables = [c for c in spec if c.isalpha()]
+    parts     = ''.join(c for c in spec if not c.isalpha()).split("*")
+    if parts and parts[-1] == "":
+        parts = parts[:-1]                  # trailing '*' is allowed
+
+    if not variables:
+        raise OperandError(f"no variables in operands {spec!r}")
+    if len(parts) != len(variables):
+        raise OperandError(f"{len(variables)} variables but {len(parts)} ranges in {spec!r}")
+    try:
+        nodes = [_parse_node(part.strip()) for part in parts]
+    except OperandError as e:
+        raise OperandError(f"{e} in {spec!r}") from None
+
+    name = _constraint_name(constraint)
+    if name is None:
+        return OperandSpec(spec, variables, nodes)
+    if name not in CONSTRAINTS:
+        raise OperandError(f"unknown constraint {constraint!r}")
+    if len(nodes) < 2:
+        raise OperandError(f"constraint {name} needs two variables in {spec!r}")
+    try:
+        solved = CONSTRAINTS[name](nodes[0], nodes[1])
+    except OperandError as e:
+        raise OperandError(f"{e} in {spec!r}") from None
+    return OperandSpec(spec, variables, nodes, solved)
@@ -0,0 +1,120 @@
+"""question/progression.py
+
+The game-mode progression graph, compiled from gamemode_logic.xlsx.
+
+Each logic row is a node: a label, the label to move `forward` to after
+`minimum_correct` right answers in a row, and the one to fall `backward`
+to after `maximum_wrong` wrong ones. `compile_logic` turns the sheet into
+integer node ids with forward/backward/threshold arrays, so a transition
+is one array lookup, and checks it while the bank loads:
+
+  * every label appears once,
+  * every forward/backward edge names a label in the sheet,
+  * following forward (or backward) edges never comes back round,
+  * thresholds are at least 1.
+
+A sheet that breaks any of these raises `LogicError` instead of leaving
+a game stuck on a label it cannot leave.
+"""
+
+import numpy as np
+
+from question.cells import is_blank
+
+NO_NODE = -1                    # no edge / a label that is not in the graph
+
+DEFAULT_MINIMUM_CORRECT = 2
+DEFAULT_MAXIMUM_WRONG   = 3
+
+
+class LogicError(ValueError):
+    """A gamemode_logic sheet that cannot drive a game."""
+
+
+class ProgressionGraph:
+    __slots__ = ("labels", "ids", "forward", "backward", "minimum_correct", "maximum_wrong")
+
+    def __init__(self, labels, forward, backward, minimum_correct, maximum_wrong):
+        self.labels          = tuple(labels)
+        self.ids             = {lbl: i for i, lbl in enumerate(self.labels)}
+        self.forward         = _frozen(forward)
+        self.backward        = _frozen(backward)
+        self.minimum_correct = _frozen(minimum_correct)
+        self.maximum_wrong   = _frozen(maximum_wrong)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def node(self, label) -> int:
+        """Node id of `label`, or NO_NODE."""
+        return self.ids.get(label, NO_NODE)
+
+
+def _frozen(values) -> np.ndarray:
+    array = np.asarray(values, dtype=np.intp)
+    array.flags.writeable = False
+    return array
+
+
+def _find_cycle(edges, labels):
+    """A cycle of `edges` (one outgoing edge per node) as labels, or None."""
+    state = [0] * len(edges)            # 0 unvisited, 1 on the current walk, 2 done
+    for start in range(len(edges)):
+        walk, node = [], start
+        while node != NO_NODE and state[node] == 0:
+            state[node] = 1
+            walk.append(node)
+            node = int(edges[node])
+        if node != NO_NODE and state[node] == 1:
+            loop = walk[walk.index(node):]
+            return [labels[n] for n in loop + [node]]
+        for n in walk:
+            state[n] = 2
+    return None
+
+
+def compile_logic(df) -> ProgressionGraph:
+    """Compile a normalised logic frame; raises LogicError if it is not a usable graph."""
+    if len(df) == 0:
+        return ProgressionGraph([], [], [], [], [])
+
+    labels = [str(lbl).strip() for lbl in df["label"]]
+    seen = set()
+    for row, lbl in enumerate(labels, start=2):              # row 1 is the header
+        if is_blank(lbl):
+            raise LogicError(f"row {row}: blank label")
+        if lbl in seen:
+            raise LogicError(f"row {row}: label {lbl!r} appears more than once")
+        seen.add(lbl)
+    ids = {lbl: i for i, lbl in enumerate(labels)}
+
+    edges = {}
+    for column in ("forward", "backward"):
+        targets = []
+        for lbl, target in zip(labels, df[column]):
+            if is_blank(target):
+                targets.append(NO_NODE)
+                continue
+            target = str(target).strip()
+            if target not in ids:
+                raise LogicError(f"{lbl!r}: {column} label {target!r} is not in the sheet")
+            targets.append(ids[target])
+        cycle = _find_cycle(targets, labels)
+        if cycle:
+            raise LogicError(f"{column} edges loop: {' -> '.join(cycle)}")
+        edges[column] = targets
+
+    minimum_correct = df["minimum_correct"].to_numpy()
+    maximum_wrong   = df["maximum_wrong"].to_numpy()
+    for name, values in (("minimum_correct", minimum_correct), ("maximum_wrong", maximum_wrong)):
+        bad = np.flatnonzero(values < 1)
+        if len(bad):
+            raise LogicError(f"{labels[bad[0]]!r}: {name} must be at least 1")
+
+    return ProgressionGraph(labels, edges["forward"], edges["backward"],
+                            minimum_correct, maximum_wrong)
+
+
+def progression_graph(bank) -> ProgressionGraph:
+    """The logic bank's graph, compiled (and checked) once per bank version."""
+    return bank.derived("graph", lambda b: compile_logic(b.df))
@@ -0,0 +1,52 @@
+"""question/recent.py
+
+Recently shown questions, per session.
+
+Row-level tracking (`RowDeck`, `used_question_ids`) stops a session
+picking the same row twice in a row, but two draws from one row can
+still render the very same question, and workbooks often repeat one
+template over several rows. `RecentQuestions` remembers the last
+`capacity` questions as hashes of (question template, operands) in a
+ring buffer with a count per hash, so "shown recently?" and "remember
+this" are both O(1) and the memory never grows past `capacity` entries.
+"""
+
+RECENT_CAPACITY = 64     # questions remembered per session
+MAX_REDRAWS     = 8      # operand draws tried before a repeat is accepted
+
+
+class RecentQuestions:
+    __slots__ = ("_ring", "_next", "_counts")
+
+    def __init__(self, capacity: int = RECENT_CAPACITY):
+        self._ring   = [None] * capacity
+        self._next   = 0
+        self._counts = {}                  # hash -> times it is in the ring
+
+    @staticmethod
+    def key(template, operands) -> int:
+        """Hash of one rendered question: the row's template text and drawn operands."""
+        return hash((template, *operands))
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: int):
+        old = self._ring[self._next]
+        if old is not None:
+            left = self._counts[old] - 1
+            if left:
+                self._counts[old] = left
+            else:
+                del self._counts[old]
+        self._ring[self._next] = key
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._next = (self._next + 1) % len(self._ring)
+
+    def clear(self):
+        self._ring   = [None] * len(self._ring)
+        self._next   = 0
+        self._counts = {}
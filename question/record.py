@@ -0,0 +1,24 @@
+"""question/record.py
+
+The record a session hands to the UI for each question. Everything about
+a question travels in it, from the draw to the answer check and the
+session's `submit_answer`, so nothing is left behind on a processor.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    """One drawn question. Immutable, so it can be prepared ahead and passed around freely."""
+
+    text:     str
+    answer:   int | None        # None when the equation has no answer for the operands
+    operands: tuple = ()        # drawn values, in the row's variable order
+    row:      int = -1          # bank position the question was drawn from
+    label:    str = ""
+    skill:    str = ""          # the row's `type`, lower-case
+    digits:   int = 1
+
+
+NO_QUESTION = "No questions found."
@@ -0,0 +1,46 @@
+"""question/templates.py
+
+Compiled question/equation templates.
+
+A template such as `Arun has {a} apples and gets {b} more.` is split once
+into literal fragments and slot numbers (the index of the variable in the
+row's operand spec), so filling it in is a single `''.join` instead of
+one `str.replace` scan per variable. Braces that do not name one of the
+row's variables are kept as literal text, as the old replace loop did.
+"""
+
+from question.cells import PLACEHOLDER, placeholder_slots
+
+
+class Template:
+    __slots__ = ("source", "parts", "variables")
+
+    def __init__(self, source: str, parts, variables):
+        self.source    = source
+        self.parts     = tuple(parts)         # str literals and int slots
+        self.variables = tuple(variables)
+
+    def render(self, values) -> str:
+        """Fill the slots with `values` (one per variable, in spec order)."""
+        texts = [str(v) for v in values]
+        if len(texts) < len(self.variables):
+            # Not enough operands: leave the remaining placeholders as written
+            texts += [f"{{{v}}}" for v in self.variables[len(texts):]]
+        return ''.join([texts[p] if p.__class__ is int else p for p in self.parts])
+
+
+def compile_template(text: str, variables) -> Template:
+    slot_of = placeholder_slots(variables)
+
+    parts, last = [], 0
+    for m in PLACEHOLDER.finditer(text):
+        slot = slot_of.get(m.group(1))
+        if slot is None:
+            continue
+        if m.start() > last:
+            parts.append(text[last:m.start()])
+        parts.append(slot)
+        last = m.end()
+    if last < len(text):
+        parts.append(text[last:])
+    return Template(text, parts, variables)
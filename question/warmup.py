@@ -1,5 +1,14 @@
+import numpy as np
 import pandas as pd
-import os
+
+from question.bank import bank_path, get_bank, get_frame, invalidate, language_column
+from question.deck import RowDeck
+from question.loader import draw_question, make_rng
+from question.progression import (
+    DEFAULT_MAXIMUM_WRONG, DEFAULT_MINIMUM_CORRECT, NO_NODE, progression_graph,
+)
+from question.recent import RecentQuestions
+from question.record import NO_QUESTION, Question
 
 def save_game_session(state):
     """Stub for saving game state. Implement disk writing here if needed later."""
@@ -19,34 +28,8 @@ SCORE_COLOURS = {1.0: "#27AE60", 0.5: "#D4AC0D",
 # ── Excel helper ──────────────────────────────────────────────────────────────
 
 def _load_logic_df() -> pd.DataFrame:
-    """Load and normalise gamemode_logic.xlsx."""
-    fp = os.path.join(os.getcwd(), "question", "gamemode_logic.xlsx")
-    df = pd.read_excel(fp)
-    if len(df) == 0:
-        return df
-
-    df["label"] = df["label"].astype(str).str.strip()
-    df["forward"] = df["forward"].astype(str).str.strip()
-    df["backward"] = df["backward"].astype(str).str.strip()
-    df["warmup_order"] = pd.to_numeric(df["warmup_order"], errors="coerce")
-    df["minimum_correct"] = pd.to_numeric(df["minimum_correct"], errors="coerce").fillna(2).astype(int)
-    
-    # Handle the spelling typo in excel 'maximun_wrong' gracefully
-    if "maximun_wrong" in df.columns:
-        df["maximum_wrong"] = pd.to_numeric(df["maximun_wrong"], errors="coerce").fillna(3).astype(int)
-    else:
-        df["maximum_wrong"] = pd.to_numeric(df.get("maximum_wrong", 3), errors="coerce").fillna(3).astype(int)
-    return df
-
-def _load_game_df() -> pd.DataFrame:
-    """Load and normalise game_ques.xlsx. Always lower-cases 'type'."""
-    fp = os.path.join(os.getcwd(), "question", "game_ques.xlsx")
-    df = pd.read_excel(fp)
-    df["type"]       = df["type"].astype(str).str.strip().str.lower()
-    df["digits"]     = df["digits"].astype(str).str.strip().str.lower()
-    df["label"]      = df["label"].astype(str).str.strip()
-    df["difficulty"] = pd.to_numeric(df["difficulty"], errors="coerce").fillna(0).astype(int)
-    return df
+    """Shared, normalised view of gamemode_logic.xlsx."""
+    return get_frame("logic")
 
 
 BUILTIN_WARMUP_ORDER = {
@@ -100,6 +83,44 @@ def get_warmup_sequence(full_df):
     print("[FINAL WARMUP]:", [(s["label"], s["warmup_order"]) for s in steps])
     return steps
 
+class WarmupPlan:
+    """
+    The warm-up for one bank version: the ordered steps and each step's
+    row pool, worked out once (see `warmup_plan`). The pools' operand
+    specs, templates and equations are compiled up front too, so a
+    warm-up starts instantly and never goes back to the frame.
+    """
+
+    __slots__ = ("steps", "pools", "by_label")
+
+    def __init__(self, bank):
+        self.steps    = tuple(get_warmup_sequence(bank.df))
+        self.by_label = {s["label"]: s for s in self.steps}
+        pools = []
+        for step in self.steps:
+            # Primary: exact label + difficulty; fallback: same label (ignore difficulty)
+            rows = bank.rows(label=step["label"], difficulty=step["difficulty"])
+            if not len(rows):
+                rows = bank.rows(label=step["label"])
+            rows = np.array(rows, dtype=np.intp)
+            rows.flags.writeable = False
+            pools.append(rows)
+        self.pools = tuple(pools)
+
+        column = language_column()
+        for rows in self.pools:
+            for r in rows.tolist():
+                bank.equation(r)
+                bank.template(r, "question")
+                if column is not None and bank.get_column(column) is not None:
+                    bank.template(r, column)
+
+
+def warmup_plan(bank) -> WarmupPlan:
+    """The game bank's `WarmupPlan`, built on first use for each bank version."""
+    return bank.derived("warmup", WarmupPlan)
+
+
 # ── Dynamic Logic Generator ──────────────────────────────────────────────────
 def generate_logic_from_warmup(ranked_results):
     try:
@@ -137,8 +158,9 @@ def generate_logic_from_warmup(ranked_results):
             })
             
         df = pd.DataFrame(logic_rows)
-        fp = os.path.join(os.getcwd(), "question", "gamemode_logic.xlsx")
+        fp = bank_path("logic")
         df.to_excel(fp, index=False)
+        invalidate("logic")
         print(f"[DEBUG] Generated dynamic logic to {fp} with {len(ladder)} steps.")
     except Exception as e:
         import traceback
@@ -158,43 +180,38 @@ class WarmupSession:
     overlap. Results live in memory only; nothing is written to disk.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None):
         self.step_index  = 0
         self.wrong_count = 0
         self.skip_count  = 0
         self.consecutive_wrong = 0
         self.consecutive_skips = 0
         self.scores: dict[str, float] = {}
-        self._full_df    = _load_game_df()
-        self.warmup_sequence = get_warmup_sequence(self._full_df)
+        self._bank       = get_bank("game")
+        self.seed, self.rng = make_rng(seed)
+        self.recent      = RecentQuestions()
+        self._plan       = warmup_plan(self._bank)
+        self.warmup_sequence = self._plan.steps
         print(f"[WARMUP] {len(self.warmup_sequence)} steps: "
-              f"{[s['label'] for s in self.warmup_sequence]}")
-
-    # ── Processor factory ─────────────────────────────────────────────────────
-
-    def _build_processor(self, step: dict):
-        from question.loader import QuestionProcessor
-
-        q_type = step["q_type"].lower()
-        lbl    = step["label"]
-        diff   = step["difficulty"]
+              f"{[s['label'] for s in self.warmup_sequence]} seed={self.seed}")
 
-        # Primary: exact label + difficulty
-        mask = (
-            (self._full_df["label"] == lbl)
-            & (self._full_df["difficulty"] == diff)
-        )
-        filtered = self._full_df[mask].copy().reset_index(drop=True)
+    # ── Questions ─────────────────────────────────────────────────────────────
 
-        # Fallback: same label (ignore difficulty)
-        if filtered.empty:
-            mask2 = (self._full_df["label"] == lbl)
-            filtered = self._full_df[mask2].copy().reset_index(drop=True)
+    def next_question(self) -> Question | None:
+        """A question for the current step, or None once the sequence has run out."""
+        step = self.current_step()
+        if step is None:
+            return None
+        rows = self._plan.pools[self.step_index]
+        if not len(rows):
+            return Question(NO_QUESTION, None, label=step["label"])
+        position = rows[self.rng.randrange(len(rows))]
+        return draw_question(self._bank, position, self.rng, self.recent)
 
-        p = QuestionProcessor(q_type, diff, disable_dda=True, is_game_mode=True)
-        p.df                 = filtered
-        p._skip_process_file = True
-        return p
+    def questions(self):
+        """One question per step, drawn lazily until the warm-up is complete."""
+        while not self.is_complete():
+            yield self.next_question()
 
     # ── Session interface ─────────────────────────────────────────────────────
 
@@ -206,10 +223,6 @@ class WarmupSession:
             return self.warmup_sequence[self.step_index]
         return None
 
-    def get_current_processor(self):
-        s = self.current_step()
-        return self._build_processor(s) if s else None
-
     def is_complete(self) -> bool:
         return (
             self.step_index >= len(self.warmup_sequence)
@@ -257,7 +270,7 @@ class WarmupSession:
             self.step_index += 1
 
     def get_ranked_results(self) -> list[dict]:
-        seq_map = {s["label"]: s for s in self.warmup_sequence}
+        seq_map = self._plan.by_label
         result = []
         for label, score in self.scores.items():
             s = seq_map.get(label, {})
@@ -278,22 +291,15 @@ class WarmupSession:
 class GameModeSession:
     session_time   = 90
 
-    def __init__(self, ranked_list: list | None, saved_state: dict | None = None):
-        self._full_df        = _load_game_df()
-        self._logic_df       = _load_logic_df()
-        self.warmup_sequence = get_warmup_sequence(self._full_df)
-        self._seq_lookup     = {s["label"]: s for s in self.warmup_sequence}
-
-        # Build node map from logic dataframe for safe lookups
-        self.node_map = {}
-        for _, row in self._logic_df.iterrows():
-            lbl = str(row["label"]).strip()
-            self.node_map[lbl] = {
-                "forward": str(row.get("forward", "")).strip(),
-                "backward": str(row.get("backward", "")).strip(),
-                "minimum_correct": int(row.get("minimum_correct", 2)),
-                "maximum_wrong": int(row.get("maximum_wrong", 3))
-            }
+    def __init__(self, ranked_list: list | None, saved_state: dict | None = None,
+                 seed=None):
+        self._bank           = get_bank("game")
+        plan                 = warmup_plan(self._bank)
+        self.warmup_sequence = plan.steps
+        self._seq_lookup     = plan.by_label
+
+        # Progression runs on the compiled logic graph (question/progression.py)
+        self.graph = progression_graph(get_bank("logic"))
 
         # Keep ranked list around for stats
         ranked_scores = {e["label"]: e.get("score", 0.0) for e in (ranked_list or [])}
@@ -311,14 +317,24 @@ class GameModeSession:
         if saved_state and "current_label" in saved_state:
             self.current_label = saved_state["current_label"]
             self.questions_in_current_label = saved_state.get("questions_in_current_label", 0)
-            self.used_question_ids = set(saved_state.get("used_question_ids", []))
+            self._resumed_ids = set(saved_state.get("used_question_ids", []))
         else:
             # Setup based directly on the first skill loaded in gamemode_logic.xlsx
-            if not self._logic_df.empty:
-                self.current_label = str(self._logic_df.iloc[0]["label"]).strip()
+            if len(self.graph):
+                self.current_label = self.graph.labels[0]
             else:
                 self.current_label = self.warmup_sequence[0]["label"] if self.warmup_sequence else ""
-            self.used_question_ids = set()
+            self._resumed_ids = set()
+        self._decks = {}                 # label -> RowDeck of that label's bank rows
+        self._unshown_row = -1           # drawn ahead for the UI, not on screen yet
+
+        # A resumed game keeps its seed, so the stream can be replayed end to end
+        if seed is None and saved_state:
+            seed = saved_state.get("seed")
+        self._node = self.graph.node(self.current_label)
+        self.seed, self.rng = make_rng(seed)
+        print(f"[GAME] session seed={self.seed}")
+        self.recent = RecentQuestions()
 
         self.game_active = True
         self.consecutive_correct        = 0
@@ -326,7 +342,7 @@ class GameModeSession:
         self.questions_in_current_label = getattr(self, "questions_in_current_label", 0)
 
         # Scoring
-        self.accumulated_points    = {lbl: 0.0 for lbl in self.node_map.keys()}
+        self.accumulated_points    = {lbl: 0.0 for lbl in self.graph.labels}
         self.question_count        = 0
         self.correct_count         = 0
         self._last_question_text   = None
@@ -339,50 +355,64 @@ class GameModeSession:
             "difficulty": 0
         }
 
-    def build_processor(self, config: dict):
-        from question.loader import QuestionProcessor
+    def _label_deck(self, lbl: str) -> RowDeck:
+        """The label's rows, dealt once each before any repeats; built on first use."""
+        deck = self._decks.get(lbl)
+        if deck is None:
+            rows  = self._bank.rows(label=lbl)
+            ids   = self._bank.get_column("id")
+            dealt = ()
+            if ids is not None and self._resumed_ids:
+                dealt = [r for r in rows if ids[r] in self._resumed_ids]
+                self._resumed_ids.difference_update(ids[rows].tolist())
+            deck  = self._decks[lbl] = RowDeck(rows, self.rng, dealt)
+        return deck
+
+    @property
+    def used_question_ids(self) -> set:
+        """
+        ids of the rows dealt in each label's current round (saved with the
+        game), leaving out a question drawn ahead that was never shown.
+        """
+        ids = self._bank.get_column("id")
+        if ids is None:
+            return set()
+        used = set(self._resumed_ids)       # labels not played since resuming
+        for deck in self._decks.values():
+            used.update(ids[deck.dealt()].tolist())
+        if self._unshown_row >= 0:
+            used.discard(ids[self._unshown_row])
+        return used
+
+    def next_question(self, config: dict) -> Question:
         lbl  = config.get("label", "").strip()
-
-        # Primary filter by label
-        filtered = self._full_df[self._full_df["label"] == lbl].copy().reset_index(drop=True)
-
-        if not filtered.empty:
-            valid_rows = filtered
-            
-            # 1. Filter out used IDs
-            if "id" in valid_rows.columns:
-                unused_rows = valid_rows[~valid_rows["id"].isin(self.used_question_ids)]
-                if unused_rows.empty:
-                    # They exhausted the pool! Reset just for this label
-                    self.used_question_ids.clear()
-                    unused_rows = valid_rows
-                valid_rows = unused_rows
-
-            # 2. Filter out immediate repeat by text gracefully
-            if len(valid_rows) > 1 and self._last_question_text is not None and "question" in valid_rows.columns:
-                non_repeat_rows = valid_rows[valid_rows["question"] != self._last_question_text]
-                if not non_repeat_rows.empty:
-                    valid_rows = non_repeat_rows
-                    
-            selected_row = valid_rows.sample(n=1)
-            
-            # Track it!
-            if "id" in selected_row.columns:
-                self.used_question_ids.add(selected_row.iloc[0]["id"])
-            if "question" in selected_row.columns:
-                self._last_question_text = selected_row.iloc[0]["question"]
-                
-            filtered = selected_row.copy().reset_index(drop=True)
-
-            q_type = filtered.iloc[0]["type"]
-        else:
-            q_type = "addition"
-
-        # Game mode no longer fetches via Excel difficulty level
-        p = QuestionProcessor(q_type, 0, disable_dda=True, is_game_mode=True)
-        p.df = filtered
-        p._skip_process_file = True
-        return p
+        deck = self._label_deck(lbl)
+        if not len(deck):
+            return Question(NO_QUESTION, None, label=lbl)
+
+        # Each row once per round, and not the same question text twice running
+        questions = self._bank.get_column("question")
+        last      = self._last_question_text
+        position  = deck.draw(None if last is None or questions is None
+                              else lambda r: questions[r] == last)
+        if questions is not None:
+            self._last_question_text = questions[position]
+
+        self._unshown_row = position
+        return draw_question(self._bank, position, self.rng, self.recent)
+
+    def question_shown(self, question: Question):
+        """The UI put `question` on screen, so its row counts as used from now on."""
+        if question.row == self._unshown_row:
+            self._unshown_row = -1
+
+    def questions(self):
+        """Questions for the current label, drawn lazily until the game has nowhere to go."""
+        while self.game_active:
+            config = self.get_next_question_config()
+            if config is None:
+                return
+            yield self.next_question(config)
 
     @staticmethod
     def calc_score(is_correct: bool, elapsed: float) -> float:
@@ -391,9 +421,9 @@ class GameModeSession:
         if elapsed <= SCORE_MEDIUM_THRESHOLD: return 0.5
         return 0.2
 
-    def submit_answer(self, config: dict, is_correct: bool, elapsed: float) -> float:
+    def submit_answer(self, question: Question, is_correct: bool, elapsed: float) -> float:
         score = self.calc_score(is_correct, elapsed)
-        label = config.get("label", "")
+        label = question.label
         if label in self.accumulated_points:
             self.accumulated_points[label] += score
         self.question_count += 1
@@ -403,15 +433,18 @@ class GameModeSession:
         self._apply_progression(is_correct)
         return score
 
-    def skip_question(self, config: dict):
+    def skip_question(self, question: Question):
         self.question_count += 1
         self._apply_progression(False)
 
     def _apply_progression(self, is_correct: bool):
         self.questions_in_current_label += 1
-        node = self.node_map.get(self.current_label, {})
-        min_correct = node.get("minimum_correct", 2)
-        max_wrong = node.get("maximum_wrong", 3)
+        node = self._node
+        if node == NO_NODE:
+            min_correct, max_wrong = DEFAULT_MINIMUM_CORRECT, DEFAULT_MAXIMUM_WRONG
+        else:
+            min_correct = self.graph.minimum_correct[node]
+            max_wrong   = self.graph.maximum_wrong[node]
 
         if is_correct:
             self.consecutive_correct += 1
@@ -426,25 +459,22 @@ class GameModeSession:
                 self.consecutive_wrong = 0
                 self._move_backward()
 
+    def _move(self, edges) -> bool:
+        if self._node == NO_NODE:
+            return False
+        nxt = int(edges[self._node])
+        if nxt == NO_NODE:
+            return False
+        self._node         = nxt
+        self.current_label = self.graph.labels[nxt]
+        self.questions_in_current_label = 0
+        return True
+
     def _move_forward(self):
-        node = self.node_map.get(self.current_label)
-        if not node: return False
-        nxt = node.get("forward", "")
-        if nxt and str(nxt).lower() != "nan" and nxt in self.node_map:
-            self.current_label = nxt
-            self.questions_in_current_label = 0
-            return True
-        return False
+        return self._move(self.graph.forward)
 
     def _move_backward(self):
-        node = self.node_map.get(self.current_label)
-        if not node: return False
-        prv = node.get("backward", "")
-        if prv and str(prv).lower() != "nan" and prv in self.node_map:
-            self.current_label = prv
-            self.questions_in_current_label = 0
-            return True
-        return False
+        return self._move(self.graph.backward)
 
     # ── Results & Formatters ──────────────────────────────────────────────────
 
@@ -472,5 +502,6 @@ class GameModeSession:
         return {
             "current_label": self.current_label,
             "questions_in_current_label": getattr(self, "questions_in_current_label", 0),
-            "used_question_ids": list(self.used_question_ids)
+            "used_question_ids": list(self.used_question_ids),
+            "seed": self.seed,
         }
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    # The banks are found relative to the working directory, as in the app
+    monkeypatch.chdir(ROOT)
+
+
+OPS = {"addition": "+", "subtraction": "-", "multiplication": "*", "division": "/"}
+CONSTRAINTS = {"subtraction": "non_negative", "division": "exact_division"}
+
+
+def write_game_workbook(path):
+    """A small game_ques.xlsx: labels 1D_/2D_<op>, three rows per label and level."""
+    import pandas as pd
+
+    rows = []
+    for op, sign in OPS.items():
+        for digits in (1, 2):
+            lo, hi = 10 ** (digits - 1), 10 ** digits - 1
+            for difficulty in range(4):
+                for k in range(3):
+                    rows.append({
+                        "id":         len(rows) + 1,
+                        "type":       op,
+                        "digits":     f"{digits}d",
+                        "label":      f"{digits}D_{op}",
+                        "difficulty": difficulty,
+                        "operands":   f"a{lo}:{hi}*b1:{hi}",
+                        "constraint": CONSTRAINTS.get(op, ""),
+                        "question":   f"({k}) What is {{a}} {sign} {{b}}?",
+                        "equation":   f"{{a}} {sign} {{b}}",
+                        "time":       10,
+                    })
+    pd.DataFrame(rows).to_excel(path, index=False)
+
+
+@pytest.fixture
+def game_banks(tmp_path, monkeypatch):
+    """
+    Scratch copies of the workbooks with a generated game bank, and an
+    empty registry, for tests that play game-mode sessions.
+    """
+    import shutil
+
+    from question import bank as registry
+
+    folder = tmp_path / "question"
+    folder.mkdir()
+    write_game_workbook(folder / registry.BANK_FILES["game"])
+    for name in ("learning", "logic"):
+        shutil.copy(registry.bank_path(name), folder)
+    monkeypatch.chdir(tmp_path)
+    registry.invalidate()
+    yield folder
+    registry.invalidate()
@@ -0,0 +1,113 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from question import bank as registry
+from question.bank import QuestionBank
+from question.loader import QuestionProcessor
+
+
+def make_bank(**columns):
+    df = pd.DataFrame(columns)
+    return QuestionBank("test", "test.xlsx", df, (0, 0))
+
+
+def test_df_edits_do_not_reach_the_bank():
+    bank = make_bank(question=["{a} + {b}", "{a} - {b}"], operands=["a1:9*b1:9"] * 2)
+
+    frame = bank.df
+    frame.loc[0, "question"] = "changed"
+    frame["operands"] = "a1*b1"
+
+    assert list(bank.df["question"]) == ["{a} + {b}", "{a} - {b}"]
+    assert list(bank.column("operands")) == ["a1:9*b1:9"] * 2
+
+
+def test_columns_are_read_only():
+    bank = make_bank(difficulty=[1, 2, 3])
+    column = bank.column("difficulty")
+    assert not column.flags.writeable
+
+
+# ── Registry ─────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def workbook_copy(tmp_path, monkeypatch):
+    """The learning workbook in a scratch folder, with an empty registry."""
+    os.mkdir(tmp_path / "question")
+    shutil.copy(registry.bank_path("learning"), tmp_path / "question")
+    monkeypatch.chdir(tmp_path)
+    registry.invalidate()
+    yield registry.bank_path("learning")
+    registry.invalidate()
+
+
+def test_get_bank_leaves_an_edited_workbook_to_reload_bank(workbook_copy):
+    first = registry.get_bank("learning")
+    stat  = os.stat(workbook_copy)
+    os.utime(workbook_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert registry.is_stale("learning")
+    assert registry.get_bank("learning") is first
+
+    reloaded, _ = registry.reload_bank("learning")
+    assert reloaded.version > first.version
+    assert registry.get_bank("learning") is reloaded
+
+
+def test_processor_keeps_the_bank_it_was_built_with(workbook_copy):
+    processor = QuestionProcessor("addition", 1)
+    processor.next_question()
+    built_with = processor.bank
+
+    stat = os.stat(workbook_copy)
+    os.utime(workbook_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    reloaded, _ = registry.reload_bank("learning")
+
+    processor.next_question()
+    assert processor.bank is built_with
+
+    later = QuestionProcessor("addition", 1)
+    later.next_question()
+    assert later.bank is reloaded
+
+
+def write_logic(path, rows):
+    pd.DataFrame(rows, columns=["label", "forward", "backward", "warmup_order",
+                                "minimum_correct", "maximum_wrong"]).to_excel(path, index=False)
+
+
+def test_a_bad_reload_keeps_the_previous_version(game_banks):
+    from question.bank_loader import BankWorker
+    from question.progression import progression_graph
+
+    path = registry.bank_path("logic")
+    write_logic(path, [("1D_addition", "2D_addition", None, 1, 3, 2),
+                       ("2D_addition", None, "1D_addition", 2, 3, 2)])
+    good, _ = registry.reload_bank("logic")
+    assert len(progression_graph(good)) == 2
+
+    # A forward loop: the sheet reads fine but cannot drive a game
+    write_logic(path, [("1D_addition", "2D_addition", None, 1, 3, 2),
+                       ("2D_addition", "1D_addition", None, 2, 3, 2)])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    worker, failed = BankWorker(), []
+    worker.failed.connect(lambda name, error: failed.append((name, error)))
+    worker.reload("logic")
+
+    assert failed and failed[0][0] == "logic" and "loop" in failed[0][1]
+    assert registry.get_bank("logic") is good
+
+
+def _levels(df):
+    return set(zip(df["type"].astype(str).str.strip().str.lower(), df["difficulty"]))
+
+
+def test_no_shipped_level_is_emptied_by_compiling(workbook_copy):
+    shipped  = _levels(pd.read_excel(workbook_copy))
+    compiled = _levels(registry.compile_workbook(workbook_copy))
+    assert shipped - compiled == set()
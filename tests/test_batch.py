@@ -0,0 +1,41 @@
+import numpy as np
+
+from question.bank import get_bank
+from question.batch import generate_batch
+from question.loader import QuestionProcessor
+
+
+def learning_view():
+    return get_bank("learning").view()
+
+
+def test_same_seed_same_batch():
+    view = learning_view()
+    assert generate_batch(view, 500, seed=7) == generate_batch(view, 500, seed=7)
+    assert generate_batch(view, 500, seed=7) != generate_batch(view, 500, seed=8)
+
+
+def test_generator_seed_continues_its_stream():
+    view = learning_view()
+    rng  = np.random.default_rng(11)
+    first, second = generate_batch(view, 50, rng), generate_batch(view, 50, rng)
+    again = np.random.default_rng(11)
+    assert generate_batch(view, 50, again) == first
+    assert generate_batch(view, 50, again) == second
+
+
+def test_processor_batches_follow_its_seed():
+    def batches(seed):
+        processor = QuestionProcessor("addition", 1, seed=seed)
+        return processor.generate_batch(100), processor.generate_batch(100)
+
+    assert batches(5) == batches(5)
+    texts, answers = batches(5)[0]
+    assert len(texts) == len(answers) == 100
+    assert all(isinstance(a, int) for a in answers)
+
+
+def test_empty_or_zero():
+    view = learning_view()
+    assert generate_batch(view, 0, seed=1) == ([], [])
+    assert generate_batch(view.take([]), 10, seed=1) == ([], [])
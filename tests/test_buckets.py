@@ -0,0 +1,22 @@
+from question.bank import get_bank
+from question.buckets import bucket_plan
+
+
+def test_levels_walk_operations_then_digits(game_banks):
+    plan  = bucket_plan(get_bank("game"))
+    level = plan.level(1)
+    assert level.labels == (
+        "1D_addition", "2D_addition", "1D_subtraction", "2D_subtraction",
+        "1D_multiplication", "2D_multiplication", "1D_division", "2D_division",
+    )
+
+    labels = get_bank("game").column("label")
+    for label, rows in level.rows.items():
+        assert len(rows) == 3 and not rows.flags.writeable
+        assert {labels[r] for r in rows} == {label}
+
+
+def test_plan_is_built_once_per_bank_version(game_banks):
+    bank = get_bank("game")
+    assert bucket_plan(bank) is bucket_plan(bank)
+    assert bucket_plan(bank).level(42) is bucket_plan(bank).level(0)
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from question.cells import PLACEHOLDER, is_blank, placeholder_slots
+from question.compiler import validate_row
+from question.equation import compile_equation
+from question.operands import OperandError, parse_operands
+from question.progression import LogicError, compile_logic
+from question.templates import compile_template
+
+BLANKS = [None, "", "   ", float("nan"), "nan", "NaN", "None", "none"]
+
+
+@pytest.mark.parametrize("value", BLANKS)
+def test_blank_cells(value):
+    assert is_blank(value)
+
+
+@pytest.mark.parametrize("value", [0, "0", "a1:9", "none of these"])
+def test_filled_cells(value):
+    assert not is_blank(value)
+
+
+def test_placeholders():
+    assert PLACEHOLDER.findall("{a} + {b1} - { c } {}") == ["a", "b1"]
+
+
+def test_templates_and_equations_agree_on_slots():
+    variables = ["a", "b", "a"]
+    assert placeholder_slots(variables) == {"a": 0, "b": 1}
+    assert compile_template("{a} - {b}", variables).render([7, 2, 5]) == "7 - 2"
+    assert compile_equation("{a} - {b}", variables).evaluate([7, 2, 5]) == 5
+
+
+@pytest.mark.parametrize("value", BLANKS)
+def test_every_reader_treats_blank_the_same(value):
+    with pytest.raises(OperandError, match="empty operands"):
+        parse_operands(value)
+    assert parse_operands("a1:9*b1:9", constraint=value).constraint is None
+    assert validate_row({"question": value, "operands": "a1:9", "equation": "{a}"}) \
+        == "empty question"
+
+    logic = pd.DataFrame({"label": ["A"], "forward": [value], "backward": [value],
+                          "minimum_correct": [2], "maximum_wrong": [3]})
+    graph = compile_logic(logic)
+    assert graph.forward[0] == graph.backward[0] == -1
+    with pytest.raises(LogicError, match="blank label"):
+        compile_logic(logic.assign(label=[value]))
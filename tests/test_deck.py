@@ -0,0 +1,67 @@
+import random
+
+from question.deck import MAX_TRIES, RowDeck
+
+
+def deal(deck, n, **kwargs):
+    return [deck.draw(**kwargs) for _ in range(n)]
+
+
+def test_every_row_once_per_round():
+    rows = [3, 8, 15, 16, 23, 42]
+    deck = RowDeck(rows, random.Random(1))
+    for _ in range(5):
+        assert sorted(deal(deck, len(rows))) == rows
+        assert deck.remaining == 0
+    assert len(deck) == len(rows)
+
+
+def test_rounds_are_shuffled_differently():
+    deck   = RowDeck(range(20), random.Random(2))
+    rounds = [tuple(deal(deck, 20)) for _ in range(4)]
+    assert len(set(rounds)) == 4
+
+
+def test_same_rng_same_deal():
+    first  = deal(RowDeck(range(50), random.Random(9)), 120)
+    second = deal(RowDeck(range(50), random.Random(9)), 120)
+    assert first == second
+
+
+def test_dealt_and_remaining():
+    deck  = RowDeck(range(10), random.Random(3))
+    drawn = deal(deck, 4)
+    assert deck.dealt() == drawn
+    assert deck.remaining == 6
+
+
+def test_resume_from_rows_already_dealt():
+    deck = RowDeck(range(10), random.Random(4), dealt=[2, 5, 7, 99])   # 99 is not in the pool
+    assert sorted(deck.dealt()) == [2, 5, 7]
+    assert deck.remaining == 7
+    assert sorted(deal(deck, 7)) == [0, 1, 3, 4, 6, 8, 9]
+    assert sorted(deal(deck, 10)) == list(range(10))      # then a fresh round
+
+
+def test_avoid_skips_rows_while_it_can():
+    deck  = RowDeck(range(100), random.Random(5))
+    first = deal(deck, 90, avoid=lambda row: row == 0)
+    assert 0 not in first
+    assert 0 in deal(deck, 10)                  # an avoided row stays in the deck
+
+
+def test_avoid_gives_up_after_max_tries():
+    calls = []
+
+    def avoid_everything(row):
+        calls.append(row)
+        return True
+
+    deck = RowDeck(range(10), random.Random(6))
+    assert deck.draw(avoid=avoid_everything) in range(10)
+    assert len(calls) == MAX_TRIES - 1
+
+
+def test_single_row():
+    deck = RowDeck([7], random.Random(0))
+    assert deal(deck, 3, avoid=lambda row: True) == [7, 7, 7]
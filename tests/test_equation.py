@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from question.equation import EquationError, compile_equation
+
+
+@pytest.mark.parametrize("text, values, answer", [
+    ("{a} + {b}",           (3, 4),    7),
+    ("({a} + {b}) * {c}",   (1, 2, 3), 9),
+    ("{a} × {b}",           (6, 7),    42),
+    ("{a} // {b} + {a} % {b}", (17, 5), 5),
+    ("-{a} + +{b}",         (2, 9),    7),
+    ("{a} ** 2",            (5,),      25),
+    ("{a} / {b}",           (7, 2),    3.5),
+])
+def test_arithmetic(text, values, answer):
+    assert compile_equation(text, "abc"[:len(values)]).evaluate(values) == answer
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os').system('echo hi')",
+    "{a}.__class__",
+    "abs({a})",
+    "{a} if {b} else 0",
+    "{a} < {b}",
+    "[{a}]",
+    "'{a}'",
+    "{a} ** {b}",
+    "{a} ** 100",
+    "({a} ** 2) ** 2",
+    "{a} & {b}",
+    "not {a}",
+    "lambda: 1",
+    "{z} + 1",
+    "{a} +",
+])
+def test_outside_the_whitelist(text):
+    with pytest.raises(EquationError):
+        compile_equation(text, "ab")
+
+
+def test_failed_arithmetic_gives_no_answer():
+    equation = compile_equation("{a} / {b}", "ab")
+    assert equation.evaluate((1, 0)) is None
+    assert equation.evaluate((1,)) is None
+
+
+def test_evaluate_many_matches_evaluate():
+    equation = compile_equation("({a} + {b}) * {c} - {a} // {c}", "abc")
+    values   = np.random.default_rng(3).integers(0, 20, size=(200, 3))
+    many     = equation.evaluate_many(values)
+    for row, got in zip(values.tolist(), many.tolist()):
+        single = equation.evaluate(row)
+        if single is None:
+            assert np.isnan(got)
+        else:
+            assert got == pytest.approx(single)
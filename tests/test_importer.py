@@ -0,0 +1,88 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from openpyxl import Workbook
+from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
+
+from question.importer import import_running, import_workbook, start_import
+
+
+class Dialog(QObject):
+    """Stands in for the progress dialog: lives on the GUI thread."""
+    canceled = pyqtSignal()
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def write_workbook(path, rows, bad=()):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["question", "operands", "equation"])
+    for i in range(rows):
+        if i in bad:
+            ws.append(["{a} + {z}", "a1:9*b1:9", "{a}+{b}"])
+        else:
+            ws.append([f"Q{i}: {{a}} + {{b}}", "a1:9*b1:9", "{a}+{b}"])
+    wb.save(path)
+    return str(path)
+
+
+def wait_for(owner, app, timeout=30):
+    end = time.monotonic() + timeout
+    while import_running(owner) and time.monotonic() < end:
+        app.processEvents()
+        time.sleep(0.005)
+    app.processEvents()             # deliver what the worker queued last
+    assert not import_running(owner)
+
+
+def test_import_workbook_skips_bad_rows(tmp_path):
+    path   = write_workbook(tmp_path / "upload.xlsx", 10, bad={3})
+    result = import_workbook(path)
+    assert result.valid_rows == 9
+    assert [line for line, _ in result.errors] == [5]       # header + 0-based row 3
+
+
+def test_cancel_stops_a_running_import(tmp_path, app):
+    path   = write_workbook(tmp_path / "upload.xlsx", 20000)
+    dialog = Dialog()
+    owner  = SimpleNamespace()
+    seen   = {"progress": 0, "finished": 0, "cancelled": 0}
+
+    def on_progress(done, total):
+        seen["progress"] += 1
+        dialog.canceled.emit()          # the user presses Cancel right away
+
+    worker = start_import(
+        path, owner,
+        progress=on_progress,
+        finished=lambda result: seen.__setitem__("finished", seen["finished"] + 1),
+        cancelled=lambda: seen.__setitem__("cancelled", seen["cancelled"] + 1),
+        cancel=dialog.canceled,
+    )
+    wait_for(owner, app)
+
+    assert worker.is_cancelled
+    assert seen["cancelled"] == 1
+    assert seen["finished"] == 0
+    assert seen["progress"] < 20000 // 200     # stopped well before the end
+
+
+def test_one_import_at_a_time(tmp_path, app):
+    path  = write_workbook(tmp_path / "upload.xlsx", 2000)
+    owner = SimpleNamespace()
+    done  = []
+
+    first = start_import(path, owner, finished=done.append)
+    assert first is not None
+    assert start_import(path, owner, finished=done.append) is None
+
+    wait_for(owner, app)
+    assert len(done) == 1 and done[0].valid_rows == 2000
+    assert start_import(path, owner, finished=done.append) is not None
+    wait_for(owner, app)
+    assert len(done) == 2
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from question.operands import OperandError, parse_operands
+
+
+def carries(a, b):
+    while a or b:
+        if a % 10 + b % 10 > 9:
+            return True
+        a, b = a // 10, b // 10
+    return False
+
+
+RULES = {
+    "non_negative":   lambda a, b: a - b >= 0,
+    "exact_division": lambda a, b: b != 0 and a % b == 0,
+    "carry":          carries,
+    "no_carry":       lambda a, b: not carries(a, b),
+}
+
+
+def test_plain_draws_stay_in_range():
+    spec = parse_operands("a1:9*b5;1:3*c2,4,6*d7")
+    rng  = random.Random(1)
+    for _ in range(500):
+        a, b, c, d = spec.draw(rng)
+        assert 1 <= a <= 9 and b in (5, 10, 15) and c in (2, 4, 6) and d == 7
+    assert spec.variables == ("a", "b", "c", "d")
+
+
+@pytest.mark.parametrize("constraint", sorted(RULES))
+@pytest.mark.parametrize("spec", ["a0:40*b0:40", "a10:99*b1:12", "a5:30*b3:25*c1:2"])
+def test_constrained_pairs_cover_exactly_the_valid_ones(constraint, spec):
+    compiled = parse_operands(spec, constraint)
+    first, second = compiled.nodes[:2]
+    valid = {(a, b) for a in range(first.lo, first.hi + 1) for b in range(second.lo, second.hi + 1)
+             if RULES[constraint](a, b)}
+
+    rng  = random.Random(7)
+    seen = {tuple(compiled.draw(rng)[:2]) for _ in range(60000)}
+    assert seen == valid
+
+
+@pytest.mark.parametrize("constraint", sorted(RULES))
+def test_batch_draws_meet_the_constraint(constraint):
+    compiled = parse_operands("a10:999*b2:99", constraint)
+    values   = compiled.draw_many(np.random.default_rng(3), 2000)
+    assert values.shape == (2000, 2)
+    assert all(RULES[constraint](a, b) for a, b in values.tolist())
+
+
+@pytest.mark.parametrize("spec, constraint", [
+    ("a1:5*b6:9", "non_negative"),
+    ("a7*b5", "exact_division"),
+    ("a1:4*b1:4", "carry"),
+    ("a9*b1:9", "no_carry"),
+    ("a1,2*b1:9", "non_negative"),          # a Choice is not a plain range
+    ("a1:9", "non_negative"),               # needs two variables
+    ("a1:9*b1:9", "bogus"),
+    ("a0:200000*b1:9", "exact_division"),   # too big to tabulate
+])
+def test_impossible_or_malformed_constraints(spec, constraint):
+    with pytest.raises(OperandError):
+        parse_operands(spec, constraint)
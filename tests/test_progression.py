@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from question.bank import get_bank
+from question.progression import NO_NODE, LogicError, compile_logic, progression_graph
+from question.warmup import GameModeSession, WarmupSession, generate_logic_from_warmup
+
+
+def logic(*rows):
+    return pd.DataFrame(rows, columns=["label", "forward", "backward",
+                                       "minimum_correct", "maximum_wrong"])
+
+
+LADDER = logic(
+    ("A", "B",   None, 2, 3),
+    ("B", "C",   "A",  3, 2),
+    ("C", "nan", "B",  1, 1),
+)
+
+
+def test_compiles_to_node_arrays():
+    graph = compile_logic(LADDER)
+    assert graph.labels == ("A", "B", "C") and len(graph) == 3
+    assert graph.forward.tolist() == [1, 2, NO_NODE]
+    assert graph.backward.tolist() == [NO_NODE, 0, 1]
+    assert graph.minimum_correct.tolist() == [2, 3, 1]
+    assert graph.maximum_wrong.tolist() == [3, 2, 1]
+    assert graph.node("B") == 1 and graph.node("Z") == NO_NODE
+    assert not graph.forward.flags.writeable
+
+
+def test_empty_sheet():
+    assert len(compile_logic(logic())) == 0
+
+
+@pytest.mark.parametrize("sheet, message", [
+    (logic(("A", "B", None, 2, 3), ("A", None, None, 2, 3), ("B", None, None, 2, 3)),
+     "more than once"),
+    (logic(("A", "Z", None, 2, 3)), "not in the sheet"),
+    (logic(("A", "B", None, 2, 3), ("B", "A", None, 2, 3)), "forward edges loop: A -> B -> A"),
+    (logic(("A", None, "A", 2, 3)), "backward edges loop"),
+    (logic(("A", None, None, 0, 3)), "minimum_correct must be at least 1"),
+    (logic(("A", None, None, 2, -1)), "maximum_wrong must be at least 1"),
+    (logic(("", None, None, 2, 3)), "blank label"),
+])
+def test_unusable_sheets(sheet, message):
+    with pytest.raises(LogicError, match=message):
+        compile_logic(sheet)
+
+
+def test_game_moves_along_the_graph(game_banks):
+    warmup = WarmupSession(seed=1)
+    for _ in warmup.questions():
+        warmup.submit_answer(is_correct=True, elapsed=1.0)
+    generate_logic_from_warmup(warmup.get_ranked_results())
+
+    graph = progression_graph(get_bank("logic"))
+    game  = GameModeSession(warmup.get_ranked_results(), seed=2)
+    start = game.current_label
+    assert start == graph.labels[0]
+
+    questions = game.questions()
+    for _ in range(3):                              # minimum_correct of a generated sheet
+        game.submit_answer(next(questions), is_correct=True, elapsed=1.0)
+    assert game.current_label == graph.labels[graph.forward[graph.node(start)]]
+
+    for _ in range(2):                              # maximum_wrong
+        game.skip_question(next(questions))
+    assert game.current_label == start
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+
+# pages.shared_ui plays feedback sounds; QtMultimedia needs a sound system
+pytest.importorskip("PyQt5.QtMultimedia", exc_type=ImportError)
+
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+from pages.shared_ui import QuestionWidget
+from question.loader import QuestionProcessor
+
+
+class SilentTTS:
+    def speak(self, text):   pass
+    def prepare(self, text): pass
+    def stop(self):          pass
+
+
+class RecordingTTS(SilentTTS):
+    def __init__(self):
+        self.prepared = []
+
+    def prepare(self, text):
+        self.prepared.append(text)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def quickplay_widget():
+    """A widget driven like quick play: one processor, next question via callback."""
+    window    = SimpleNamespace(current_theme="light", is_muted=True)
+    processor = QuestionProcessor("addition", 1, seed=3)
+    widget    = QuestionWidget(processor, window=window, tts=SilentTTS(),
+                               next_question_callback=lambda: widget.load_new_question())
+    return widget
+
+
+def answer_wrong(widget):
+    widget.input_box.setText(str(widget.question.answer + 1))
+    widget.check_answer()
+
+
+def test_next_question_gets_its_full_retries(app):
+    widget = quickplay_widget()
+    answer_wrong(widget)
+    answer_wrong(widget)
+    assert widget.processor.retry_count == 2       # "Let's try another one!"
+
+    widget.call_next_question()
+    assert widget.processor.retry_count == 0
+
+    answer_wrong(widget)
+    assert widget.processor.retry_count == 1
+    assert "Try Again" in widget.result_label.text()
+
+
+def test_prepare_speech_is_queued_behind_the_feedback(app):
+    tts      = RecordingTTS()
+    question = QuestionProcessor("addition", 1, seed=3).next_question()
+
+    QuestionWidget.prepare_speech(tts, question)
+    assert tts.prepared == []
+    QTest.qWait(200)
+    assert len(tts.prepared) == 1 and tts.prepared[0].startswith(question.text)
@@ -0,0 +1,52 @@
+import random
+
+import pandas as pd
+
+from question.bank import QuestionBank
+from question.loader import draw_question
+from question.recent import RecentQuestions
+
+
+def test_remembers_the_last_capacity_questions():
+    recent = RecentQuestions(capacity=3)
+    keys   = [RecentQuestions.key("{a} + {b}", (i, i)) for i in range(5)]
+    for key in keys:
+        recent.add(key)
+
+    assert len(recent) == 3
+    assert [key in recent for key in keys] == [False, False, True, True, True]
+
+
+def test_repeats_are_counted_until_their_last_copy_leaves():
+    recent = RecentQuestions(capacity=3)
+    a, b = RecentQuestions.key("q", (1,)), RecentQuestions.key("q", (2,))
+    for key in (a, b, a):
+        recent.add(key)
+    recent.add(b)                   # pushes out the first a; the second one is still there
+    recent.add(b)
+    assert a in recent and len(recent) == 2
+    recent.add(b)
+    assert a not in recent and len(recent) == 1
+
+
+def test_key_depends_on_template_and_operands():
+    key = RecentQuestions.key
+    assert key("{a} + {b}", (1, 2)) == key("{a} + {b}", [1, 2])
+    assert key("{a} + {b}", (1, 2)) != key("{a} + {b}", (2, 1))
+    assert key("{a} + {b}", (1, 2)) != key("{a} - {b}", (1, 2))
+
+
+def test_clear():
+    recent = RecentQuestions(capacity=2)
+    recent.add(1)
+    recent.clear()
+    assert len(recent) == 0 and 1 not in recent
+
+
+def test_draws_avoid_recent_repeats():
+    df   = pd.DataFrame({"question": ["{a} + 1 = ?"], "operands": ["a1:20"],
+                         "equation": ["{a} + 1"]})
+    bank = QuestionBank("test", "test.xlsx", df, (0, 0))
+    rng, recent = random.Random(4), RecentQuestions(capacity=10)
+    texts = [draw_question(bank, 0, rng, recent).text for _ in range(10)]
+    assert len(set(texts)) == 10
@@ -0,0 +1,65 @@
+from question.loader import LinearProgressionSession, QuestionProcessor
+from question.record import NO_QUESTION
+from question.warmup import GameModeSession, WarmupSession
+
+
+def play_linear(seed, answers=12):
+    session = LinearProgressionSession(2, seed=seed)
+    shown   = []
+    for i, question in zip(range(answers), session.questions()):
+        shown.append((question.text, question.answer, question.label))
+        session.submit_answer(question, is_correct=i % 3 != 2, time_taken=4.0)
+    return shown
+
+
+def play_warmup(seed):
+    session = WarmupSession(seed=seed)
+    shown   = []
+    for i, question in enumerate(session.questions()):
+        shown.append((question.text, question.answer, question.label))
+        session.submit_answer(is_correct=i % 4 != 3, elapsed=2.0)
+    return shown
+
+
+def test_linear_session_replays_from_its_seed(game_banks):
+    shown = play_linear(1234)
+    assert len(shown) == 12 and NO_QUESTION not in [text for text, _, _ in shown]
+    assert shown == play_linear(1234)
+    assert play_linear(1234) != play_linear(4321)
+
+
+def test_warmup_replays_from_its_seed(game_banks):
+    shown = play_warmup(99)
+    assert [label for _, _, label in shown][:2] == ["1D_addition", "1D_subtraction"]
+    assert shown == play_warmup(99)
+
+
+def test_processor_replays_from_its_seed():
+    def draws(seed):
+        processor = QuestionProcessor("addition", 1, seed=seed)
+        return [processor.next_question() for _ in range(30)]
+
+    assert draws(5) == draws(5)
+    assert draws(5) != draws(6)
+
+
+def test_unseeded_sessions_record_their_seed(game_banks):
+    session = LinearProgressionSession(2)
+    assert play_linear(session.seed) == play_linear(session.seed)
+
+
+def test_a_prefetched_question_is_not_saved_as_used(game_banks):
+    session = GameModeSession(None, seed=7)
+    ids     = session._bank.get_column("id")
+    shown   = session.next_question(session.get_next_question_config())
+    session.question_shown(shown)
+    ahead   = session.next_question(session.get_next_question_config())
+
+    state = session.save_state()
+    assert state["used_question_ids"] == [ids[shown.row]]
+
+    session.question_shown(ahead)
+    assert session.used_question_ids == {ids[shown.row], ids[ahead.row]}
+
+    resumed = GameModeSession(None, saved_state=state)
+    assert resumed._label_deck(state["current_label"]).dealt() == [shown.row]
@@ -0,0 +1,34 @@
+import os
+
+import language.language as lang_config
+from tts.tts_worker import TTSWorker
+
+
+def test_speaking_keeps_the_prepared_file(tmp_path, monkeypatch):
+    os.mkdir(tmp_path / "sounds")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(lang_config, "selected_language", "മലയാളം", raising=False)
+
+    names = iter(["tts_cache_question.mp3", "tts_cache_next.mp3", "tts_cache_correct.mp3"])
+
+    def synthesize(text):
+        name = next(names)
+        (tmp_path / "sounds" / name).write_bytes(b"")
+        return name
+
+    worker = TTSWorker()
+    monkeypatch.setattr(worker, "_synthesize_edge", synthesize)
+    played = []
+    worker.play_custom_sound.connect(played.append)
+
+    def cached():
+        return sorted(os.listdir(tmp_path / "sounds"))
+
+    worker.speak("question")
+    worker.prepare("next question")             # while the feedback shows
+    worker.speak("Correct!")                    # the feedback itself
+    assert cached() == ["tts_cache_correct.mp3", "tts_cache_next.mp3"]
+
+    worker.speak("next question")
+    assert played == ["tts_cache_question.mp3", "tts_cache_correct.mp3", "tts_cache_next.mp3"]
+    assert cached() == ["tts_cache_next.mp3"]
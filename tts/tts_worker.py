@@ -24,6 +24,7 @@ class TTSWorker(QObject):
         self.speech_rate = 150  # Default WPM
         self.DEFAULT_RATE = 150
         self.RATE_STEP = 25
+        self._prepared = {}  # text -> audio file synthesized ahead by prepare()
 
     @property
     def is_speaking(self):
@@ -57,21 +58,49 @@ class TTSWorker(QObject):
                 except Exception:
                     pass
 
+    def _synthesize_edge(self, text):
+        import asyncio, edge_tts, os, uuid
+        # Unique cache file
+        cache_file = f"tts_cache_{uuid.uuid4().hex[:8]}.mp3"
+        cache_path = os.path.join("sounds", cache_file)
+
+        # Direct execution avoiding Subprocess interpreter latency
+        communicate = edge_tts.Communicate(text, "ml-IN-SobhanaNeural")
+        asyncio.run(communicate.save(cache_path))
+        return cache_file
+
+    def _evict_cache(self, playing):
+        # The worker owns the synthesized files: keep the one about to play
+        # and any prepared ahead, delete the rest.
+        import os
+        keep = {playing, *self._prepared.values()}
+        try:
+            for f in os.listdir("sounds"):
+                if f.startswith("tts_cache_") and f not in keep:
+                    os.remove(os.path.join("sounds", f))
+        except OSError:
+            pass
+
+    def prepare(self, text):
+        # Synthesize the next question while the current one is on screen.
+        # Only the Malayalam voice renders to a file; espeak-ng and SAPI
+        # speak directly, so for them there is nothing to do ahead of time.
+        current_lang = getattr(lang_config, 'selected_language', 'English')
+        if current_lang != "മലയാളം" or text in self._prepared:
+            return
+        try:
+            self._prepared = {text: self._synthesize_edge(text)}
+        except Exception as e:
+            print("[Edge TTS Error] Prepare failed:", e)
+
     def speak(self, text):
         current_lang = getattr(lang_config, 'selected_language', 'English')
         
         # Malayalam support
         if current_lang == "മലയാളം":
-            import asyncio, edge_tts, os, uuid
             try:
-                # Unique cache file
-                cache_file = f"tts_cache_{uuid.uuid4().hex[:8]}.mp3"
-                cache_path = os.path.join("sounds", cache_file)
-
-                # Direct execution avoiding Subprocess interpreter latency
-                communicate = edge_tts.Communicate(text, "ml-IN-SobhanaNeural")
-                asyncio.run(communicate.save(cache_path))
-                
+                cache_file = self._prepared.pop(text, None) or self._synthesize_edge(text)
+                self._evict_cache(cache_file)
                 self.play_custom_sound.emit(cache_file)
                 return # Skip standard fallback logic
             except Exception as e:
@@ -281,6 +310,7 @@ class TTSWorker(QObject):
 
 class TextToSpeech(QObject):
     speak_signal = pyqtSignal(str)
+    prepare_signal = pyqtSignal(str)
     play_custom_sound_signal = pyqtSignal(str) # 👈 Forward Signal
     stop_signal = pyqtSignal()
     reset_signal = pyqtSignal()
@@ -300,6 +330,7 @@ class TextToSpeech(QObject):
         self.iterate_timer.start(100)
         
         self.speak_signal.connect(self.worker.speak)
+        self.prepare_signal.connect(self.worker.prepare)
         self.worker.play_custom_sound.connect(self.play_custom_sound_signal.emit) # 👈 Connect forward
         self.stop_signal.connect(self.worker.stop)
         self.reset_signal.connect(self.worker.reset)
@@ -312,6 +343,9 @@ class TextToSpeech(QObject):
     def speak(self, text):
         self.speak_signal.emit(text)
 
+    def prepare(self, text):
+        self.prepare_signal.emit(text)
+
     def stop(self):
         self.stop_signal.emit()
         